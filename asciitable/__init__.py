@@ -26,14 +26,18 @@
 ## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS  
 ## SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import sys
+
 from asciitable.core import (has_numpy,
                              InconsistentTableError,
                              NoType, StrType, NumType, FloatType, IntType, AllType,
                              Column, Keyword,
                              BaseInputter, ContinuationLinesInputter,
+                             MmapInputter, MmapLines,
                              BaseHeader,
                              BaseData,
                              BaseOutputter, NumpyOutputter, DictLikeNumpy,
+                             LazyOutputter, LazyTable,
                              BaseReader, 
                              BaseSplitter, DefaultSplitter, WhitespaceSplitter,
                              convert_list, convert_numpy,
@@ -51,6 +55,10 @@ from asciitable.memory import Memory, MemoryReader
 from asciitable.fixedwidth import (FixedWidth, FixedWidthNoHeader,
                                    FixedWidthTwoLine, FixedWidthSplitter,
                                    FixedWidthHeader, FixedWidthData)
-from asciitable.ui import (set_guess, get_reader, read, get_writer, write)
+from asciitable.incremental import IncrementalReader
+from asciitable.ui import (set_guess, get_reader, read, read_chunks, read_many, build_index,
+                           get_writer, write)
+if sys.version_info >= (3, 5):
+    from asciitable.aio import aread, awrite
 
 from asciitable.version import version as __version__
@@ -0,0 +1,197 @@
+"""Asciitable: an extensible ASCII table reader and writer.
+
+aio.py:
+  Coroutines to read and write tables from an asyncio event loop
+
+:Copyright: Smithsonian Astrophysical Observatory (2011)
+:Author: Tom Aldcroft (aldcroft@head.cfa.harvard.edu)
+"""
+
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##     * Redistributions of source code must retain the above copyright
+##       notice, this list of conditions and the following disclaimer.
+##     * Redistributions in binary form must reproduce the above copyright
+##       notice, this list of conditions and the following disclaimer in the
+##       documentation and/or other materials provided with the distribution.
+##     * Neither the name of the Smithsonian Astrophysical Observatory nor the
+##       names of its contributors may be used to endorse or promote products
+##       derived from this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+## ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+## WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+## DISCLAIMED. IN NO EVENT SHALL <COPYRIGHT HOLDER> BE LIABLE FOR ANY
+## DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+## (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+## LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+## ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+## SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# This module uses the async/await syntax of Python 3.5+ and is only imported
+# by the package on those versions.
+
+import os
+import locale
+import asyncio
+import inspect
+import functools
+import collections
+import queue
+
+import asciitable.ui as ui
+
+# Number of bytes read from an input stream at a time
+READ_CHUNK_SIZE = 1 << 16
+
+# Number of output lines sent to an output stream at a time
+WRITE_CHUNK_LINES = 1000
+
+async def aread(table, numpy=True, guess=None, executor=None, **kwargs):
+    """Coroutine to read the input ``table`` without blocking the event loop.
+    The parameters and returned table are the same as for :func:`read`.
+
+    The ``table`` can be an async byte stream, i.e. an object with a coroutine
+    ``read(n)`` method such as an ``asyncio.StreamReader``.  The stream is read
+    in the event loop and the data are passed as they arrive to the table
+    reader running in ``executor``, so the table is split and converted while
+    it is still being received.  When guessing the table format all of the
+    lines are needed first, so set ``Reader`` (and ``guess=False``) to parse
+    incrementally.  Any other ``table`` input is read with :func:`read` in
+    ``executor``.
+
+    :param table: input table (async byte stream, file name, list of strings, or single newline-separated string)
+    :param numpy: use the :class:`NumpyOutputter` class else use :class:`BaseOutputter` (default=True)
+    :param guess: try to guess the table format (default=True)
+    :param executor: concurrent.futures executor (default=None for the event loop default executor)
+    :param encoding: encoding of the table stream or file (default=None for the platform default)
+    :returns: output table
+    """
+    loop = asyncio.get_event_loop()
+    if not inspect.iscoroutinefunction(getattr(table, 'read', None)):
+        read = functools.partial(ui.read, table, numpy=numpy, guess=guess, **kwargs)
+        return await loop.run_in_executor(executor, read)
+
+    fileobj = _StreamFile(kwargs.get('encoding') or locale.getpreferredencoding(False))
+    future = loop.run_in_executor(executor, _read_stream, fileobj, numpy, guess, kwargs)
+    read = None
+    try:
+        # Stop feeding when the reader is finished, which can be early (e.g.
+        # for ``nrows``) or on an error, even if the stream is still open.
+        while not future.done():
+            read = asyncio.ensure_future(table.read(READ_CHUNK_SIZE))
+            await asyncio.wait([read, future], return_when=asyncio.FIRST_COMPLETED)
+            if not read.done():
+                break
+            chunk = read.result()
+            read = None
+            if not chunk:
+                break
+            fileobj.feed(chunk)
+    except BaseException:
+        # The reader result is not awaited, so retrieve its exception (if
+        # any) to keep it from being reported as never retrieved.
+        future.add_done_callback(lambda x: x.cancelled() or x.exception())
+        raise
+    finally:
+        if read is not None and not read.done():
+            read.cancel()
+        fileobj.feed_eof()
+    return await future
+
+def _read_stream(fileobj, numpy, guess, kwargs):
+    """Read the table from the _StreamFile ``fileobj`` in an executor."""
+    if guess is None:
+        guess = ui._GUESS
+    if guess:
+        return ui.read(fileobj, numpy=numpy, guess=guess, **kwargs)
+
+    reader = ui.get_reader(**ui._get_outputter_kwargs(numpy, kwargs))
+    if reader.data.nrows is None and not reader.data.skiprows:
+        # Stream the lines as they arrive instead of waiting for all of them
+        return reader.read_rows(fileobj, slice(0, None))
+    return reader.read(fileobj)
+
+class _StreamFile(object):
+    """Read-only file-like object whose bytes are fed from the event loop and
+    which is read as text with ``encoding`` in another thread.  Reading blocks
+    until enough data have been fed or feed_eof() has been called."""
+    def __init__(self, encoding):
+        self.encoding = encoding
+        self._chunks = queue.Queue()
+        self._lines = collections.deque()
+        self._partial = b''
+        self._eof = False
+
+    def feed(self, chunk):
+        self._chunks.put(chunk)
+
+    def feed_eof(self):
+        self._chunks.put(None)
+
+    def readline(self):
+        while not self._lines and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+                if self._partial:
+                    self._lines.append(self._partial)
+            else:
+                lines = (self._partial + chunk).splitlines(True)
+                # Keep an incomplete last line (or a '\r' that may be followed
+                # by '\n') until the next chunk arrives.
+                if lines and not lines[-1].endswith(b'\n'):
+                    self._partial = lines.pop()
+                else:
+                    self._partial = b''
+                self._lines.extend(lines)
+        if not self._lines:
+            return ''
+        return self._lines.popleft().decode(self.encoding)
+
+    def read(self):
+        return ''.join(iter(self.readline, ''))
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+async def awrite(table, output, executor=None, encoding=None, **kwargs):
+    """Coroutine to write the input ``table`` without blocking the event loop.
+    The parameters are the same as for :func:`write`.  The output lines are
+    formatted in ``executor``.
+
+    The ``output`` can be an async byte stream, i.e. an ``asyncio.StreamWriter``
+    (``write()`` plus a coroutine ``drain()``) or an object with a coroutine
+    ``write()`` method.  The lines are then encoded with ``encoding`` and
+    written in chunks, waiting for the stream to drain after each chunk.  Any
+    other ``output`` is written with :func:`write` in ``executor``.
+
+    :param table: input table (Reader object, NumPy struct array, list of lists, etc)
+    :param output: output (async byte stream, file name, or file-like object)
+    :param executor: concurrent.futures executor (default=None for the event loop default executor)
+    :param encoding: encoding for an async byte stream (default=None for the platform default)
+    :param Writer: Writer class (default= :class:`~asciitable.Basic` )
+    """
+    loop = asyncio.get_event_loop()
+    if hasattr(output, 'drain'):
+        write = output.write
+    elif inspect.iscoroutinefunction(getattr(output, 'write', None)):
+        write = None
+    else:
+        await loop.run_in_executor(executor, functools.partial(ui.write, table, output, **kwargs))
+        return
+
+    writer = kwargs.pop('Writer', None)
+    lines = await loop.run_in_executor(executor, ui._get_write_lines, table, writer, kwargs)
+    encoding = encoding or locale.getpreferredencoding(False)
+    for i in range(0, len(lines), WRITE_CHUNK_LINES):
+        chunk = ''.join(x + os.linesep for x in lines[i:i + WRITE_CHUNK_LINES])
+        chunk = chunk.encode(encoding)
+        if write is None:
+            await output.write(chunk)
+        else:
+            write(chunk)
+            await output.drain()
@@ -147,7 +147,8 @@ class CdsHeader(core.BaseHeader):
                         col.null = '---'
                     else:
                         col.null = match.group('nullval')
-                    self.data.fill_values.append((col.null, fillval, col.name))
+                    # Not append() since fill_values may be the BaseData class list
+                    self.data.fill_values = self.data.fill_values + [(col.null, fillval, col.name)]
 
                 cols.append(col)
             else:  # could be a continuation of the previous col's description
@@ -189,7 +190,7 @@ class CdsData(core.BaseData):
                       if x.startswith('------') or x.startswith('=======')]
         if not i_sections:
             raise core.InconsistentTableError('No CDS section delimiter found')
-        return lines[i_sections[-1]+1 : ]
+        return core._slice_lines(lines, i_sections[-1] + 1)
 
 
 class Cds(core.BaseReader):
@@ -33,7 +33,14 @@ import os
 import sys
 import re
 import csv
+import copy
+import numbers
+import operator
+import mmap
+import array
+import warnings
 import itertools
+import collections
 
 try:
     import numpy
@@ -57,8 +64,10 @@ except NameError:
 
 try:
     izip = itertools.izip
+    imap = itertools.imap
 except AttributeError:
     izip = zip
+    imap = map
 
 try:
     long = long
@@ -117,11 +126,13 @@ class Column(object):
     * **type** : column type (NoType, StrType, NumType, FloatType, IntType)
     * **str_vals** : list of column values as strings
     * **data** : list of converted column values
+    * **encoding** : encoding of the ``str_vals`` if they are bytes (else None)
     """
     def __init__(self, name, index):
         self.name = name
         self.index = index
         self.type = NoType
+        self.encoding = None
         self.str_vals = []
         self.fill_values = {}
         self.formatter = None
@@ -143,7 +154,21 @@ class BaseInputter(object):
     * String (newline separated) with all header and data lines (must have at least 2 lines)
     * File-like object with read() method
     * List of strings
+
+    A file (or binary file-like object) that is compressed with gzip, bzip2 or
+    xz is recognized from its leading bytes and decompressed as it is read.
+
+    If ``binary`` is True (Python 3 only) then the lines are returned as bytes
+    encoded with ``encoding`` (default utf-8) instead of as str.  The reader
+    sets this when the table data can be parsed from bytes, see
+    :meth:`BaseReader.read`.
+
+    :param encoding: encoding of the table file (default = None for the platform default)
+    :param binary: return lines as bytes
     """
+    encoding = None
+    binary = False
+
     def get_lines(self, table):
         """Get the lines from the ``table`` input.
 
@@ -151,11 +176,14 @@ class BaseInputter(object):
         :returns: list of lines
         """
         try:
-            if hasattr(table, 'read'):
-                table = table.read()
-            elif '\n' not in table and '\r' not in table + '':
-                table = open(table, 'r').read()
-            lines = table.splitlines()
+            if hasattr(table, 'read') or ('\n' not in table and '\r' not in table + ''):
+                fileobj, compressed = _open_table(table, self.encoding, self.binary)
+                if compressed:
+                    lines = list(_iter_file_lines(fileobj, close=True))
+                else:
+                    lines = fileobj.read().splitlines()
+            else:
+                lines = table.splitlines()
         except TypeError:
             try:
                 # See if table supports indexing, slicing, and iteration
@@ -166,8 +194,37 @@ class BaseInputter(object):
             except TypeError:
                 raise TypeError('Input "table" must be a string (filename or data) or an iterable')
 
+        if self.binary:
+            lines = _encode_lines(lines, self.encoding)
+
         return self.process_lines(lines)
 
+    def iter_lines(self, table):
+        """Return an iterator over the lines of the ``table`` input.  This is the
+        incremental counterpart of get_lines(): a file name or file-like object
+        is read line by line as the iterator is consumed instead of all at once.
+
+        :param table: table input
+        :returns: iterator over lines
+        """
+        if self.binary:
+            encoding = self.encoding or 'utf-8'
+        else:
+            encoding = None
+        try:
+            if hasattr(table, 'readline'):
+                fileobj, compressed = _open_table(table, self.encoding, self.binary)
+                lines = _iter_file_lines(fileobj, compressed, encoding)
+            elif hasattr(table, 'read') or '\n' in table or '\r' in table + '':
+                return iter(self.get_lines(table))
+            else:
+                fileobj = _open_table(table, self.encoding, self.binary)[0]
+                lines = _iter_file_lines(fileobj, True, encoding)
+        except TypeError:
+            return iter(self.get_lines(table))
+
+        return iter(self.process_lines(lines))
+
     def process_lines(self, lines):
         """Process lines for subsequent use.  In the default case do nothing.
         This routine is not generally intended for removing comment lines or
@@ -180,6 +237,249 @@ class BaseInputter(object):
         characters if a row is split into lines."""
         return lines
 
+def _encode_lines(lines, encoding):
+    """Return the list of ``lines`` with any str lines encoded to bytes."""
+    encoding = encoding or 'utf-8'
+    return [x.encode(encoding) if isinstance(x, unicode) else x for x in lines]
+
+_compression_magic = ((b'\x1f\x8b', 'gzip'),
+                      (b'BZh', 'bz2'),
+                      (b'\xfd7zXZ\x00', 'lzma'))
+
+def _get_compression(magic):
+    """Return the name of the compression module matching the leading bytes
+    ``magic`` of a file, or None if the file is not compressed."""
+    if isinstance(magic, bytes):
+        for prefix, compression in _compression_magic:
+            if magic.startswith(prefix):
+                return compression
+    return None
+
+def _peek_magic(fileobj):
+    """Return the leading bytes of ``fileobj`` without consuming them, or None
+    if that is not possible."""
+    try:
+        if hasattr(fileobj, 'peek'):
+            return fileobj.peek(6)[:6]
+        pos = fileobj.tell()
+        magic = fileobj.read(6)
+        fileobj.seek(pos)
+        return magic
+    except (AttributeError, IOError, ValueError):
+        return None
+
+def _decompress(source, compression, encoding=None, binary=False):
+    """Return a file object that decompresses ``source`` (file name or binary
+    file-like object) incrementally as it is read.  The file object returns
+    text decoded with ``encoding`` unless ``binary`` is True."""
+    if compression == 'gzip':
+        import gzip
+        if hasattr(source, 'read'):
+            fileobj = gzip.GzipFile(fileobj=source, mode='rb')
+        else:
+            fileobj = gzip.GzipFile(source, 'rb')
+    elif compression == 'bz2':
+        import bz2
+        fileobj = bz2.BZ2File(source)
+    else:
+        try:
+            import lzma
+        except ImportError:
+            raise ValueError('Reading xz compressed input requires the lzma module')
+        fileobj = lzma.LZMAFile(source)
+
+    if str is bytes or binary:
+        return fileobj
+    return io.TextIOWrapper(fileobj, encoding=encoding)
+
+def _open_table(table, encoding=None, binary=False):
+    """Open the file name or file-like object ``table`` for reading text
+    decoded with ``encoding`` (or bytes if ``binary`` is True), transparently
+    decompressing it if needed.
+
+    :returns: tuple (file object, whether it is decompressed)
+    """
+    if hasattr(table, 'read'):
+        compression = _get_compression(_peek_magic(table))
+        if compression is None:
+            return table, False
+        return _decompress(table, compression, encoding, binary), True
+
+    fileobj = open(table, 'rb')
+    try:
+        compression = _get_compression(fileobj.read(6))
+    finally:
+        fileobj.close()
+    if compression is not None:
+        return _decompress(table, compression, encoding, binary), True
+    if binary:
+        return open(table, 'rb'), False
+    if str is bytes or encoding is None:
+        return open(table, 'r'), False
+    return open(table, 'r', encoding=encoding), False
+
+def _iter_file_lines(fileobj, close=False, encoding=None):
+    """Yield the lines of ``fileobj`` (without line terminators) as it is read.
+    If ``encoding`` is given then any str lines are encoded to bytes."""
+    try:
+        for line in fileobj:
+            if isinstance(line, bytes):
+                yield line.rstrip(b'\r\n')
+            elif encoding is not None:
+                yield line.rstrip('\r\n').encode(encoding)
+            else:
+                yield line.rstrip('\r\n')
+    finally:
+        if close:
+            fileobj.close()
+
+class _DecodedLines(object):
+    """Sequence view of the table ``lines`` in which each line that is bytes
+    is decoded with ``encoding`` as it is accessed."""
+    def __init__(self, lines, encoding):
+        self._lines = lines
+        self.encoding = encoding
+
+    def _decode(self, line):
+        if isinstance(line, bytes):
+            return line.decode(self.encoding)
+        return line
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return _DecodedLines(self._lines[item], self.encoding)
+        return self._decode(self._lines[item])
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __bool__(self):
+        return bool(self._lines)
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        for line in self._lines:
+            yield self._decode(line)
+
+class _LineSlice(object):
+    """Sequence view of the ``lines[start:stop]`` slice of the list of table
+    ``lines`` that does not copy the list."""
+    def __init__(self, lines, start=None, stop=None):
+        self._lines = lines
+        self._start, self._stop, step = slice(start, stop).indices(len(lines))
+        self._stop = max(self._start, self._stop)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return _LineSlice(self._lines, self._start + start, self._start + max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('line index out of range')
+        return self._lines[self._start + item]
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __bool__(self):
+        return self._stop > self._start
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        # Index the list instead of iterating it from its start
+        return imap(self._lines.__getitem__, range(self._start, self._stop))
+
+def _slice_lines(lines, start=None, stop=None):
+    """Return the ``lines[start:stop]`` slice of the table ``lines``, which is
+    a _LineSlice view if ``lines`` is a list instead of a copy of the list."""
+    if isinstance(lines, list):
+        return _LineSlice(lines, start, stop)
+    return lines[start:stop]
+
+class _LineBuffer(object):
+    """Sequence of table lines which are pulled from the iterable ``lines``
+    only as they are needed.
+
+    Lines that have been pulled are cached so that the header processing can
+    scan the start of the table as often as it likes.  The ``drain()`` method
+    then hands out the cached lines followed by the rest of the input without
+    caching it.  Taking the length or using a negative index pulls in the
+    entire input.
+    """
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._cache = []
+
+    def _fill(self, n_lines=None):
+        """Pull input lines into the cache until it holds ``n_lines`` lines (or
+        all input lines if ``n_lines`` is None)."""
+        cache = self._cache
+        if n_lines is None:
+            cache.extend(self._lines)
+        else:
+            for line in itertools.islice(self._lines, max(n_lines - len(cache), 0)):
+                cache.append(line)
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if i >= len(self._cache):
+                self._fill(i + 1)
+                if i >= len(self._cache):
+                    break
+            yield self._cache[i]
+            i += 1
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            if (item.stop is None or item.stop < 0 or
+                (item.start is not None and item.start < 0)):
+                self._fill()
+            else:
+                self._fill(item.stop)
+        elif item < 0:
+            self._fill()
+        else:
+            self._fill(item + 1)
+        return self._cache[item]
+
+    def __len__(self):
+        self._fill()
+        return len(self._cache)
+
+    def __bool__(self):
+        self._fill(1)
+        return len(self._cache) > 0
+
+    __nonzero__ = __bool__
+
+    def drain(self):
+        """Yield the cached lines and then the remaining input lines without
+        caching them."""
+        for line in self._cache:
+            yield line
+        for line in self._lines:
+            yield line
+
+def _overrides(obj, name, base):
+    """Return True if ``obj`` has its own version of the ``name`` method of class
+    ``base``, either from a subclass or set as an instance attribute."""
+    return name in obj.__dict__ or getattr(obj.__class__, name) != getattr(base, name)
+
+def _drop_last(lines, n_lines):
+    """Yield all but the last ``n_lines`` of the iterable ``lines``."""
+    buffered = collections.deque()
+    for line in lines:
+        buffered.append(line)
+        if len(buffered) > n_lines:
+            yield buffered.popleft()
+
 class BaseSplitter(object):
     """Base splitter that uses python's split method to do the work.
 
@@ -197,9 +497,28 @@ class BaseSplitter(object):
       reader.header.splitter.process_val = lambda x: x.lstrip()
       reader.data.splitter.process_val = None
 
+    If ``encoding`` is set then the lines to split are bytes and the split
+    values are bytes as well.  This is used by the reader when the splitter
+    supports it, see ``supports_bytes()``.
+
+    If ``col_indexes`` is set then only the values at those indexes are
+    needed, so ``process_val()`` is applied just to them and the other values
+    are returned as split.  The reader sets this when some of the table
+    columns are excluded (e.g. with ``include_names``).
+
     :param delimiter: one-character string used to separate fields
+    :param encoding: encoding of the lines if they are bytes (default = None)
+    :param col_indexes: indexes of the values that are needed (default = None for all)
     """
     delimiter = None
+    encoding = None
+    col_indexes = None
+
+    def supports_bytes(self):
+        """Return True if the splitter can split lines that are bytes.  This is
+        the case unless the line processing or splitting has been customized."""
+        return not any(getattr(self, x) is not None and _overrides(self, x, BaseSplitter)
+                       for x in ('process_line', 'process_val', '__call__'))
 
     def process_line(self, line):
         """Remove whitespace at the beginning or end of line.  This is especially useful for
@@ -210,15 +529,62 @@ class BaseSplitter(object):
         """Remove whitespace at the beginning or end of value."""
         return val.strip()
 
+    def split_columns(self, lines):
+        """Split all of the ``lines`` at once and return a list with a numpy
+        bytes array of the values of each column, or None if the splitter
+        cannot do this (the default).  The values are encoded as ASCII, or
+        with ``encoding`` if it is set.
+
+        :param lines: sequence of lines to split
+        :returns: list of numpy arrays or None
+        """
+        return None
+
+    def split_numeric(self, lines):
+        """Split and convert all of the ``lines`` at once if every value is a
+        number and return a list with a numpy int or float array of the values
+        of each column, or None if the splitter cannot do this (the default)
+        or a value is not a number.
+
+        :param lines: sequence of lines to split
+        :returns: list of numpy arrays or None
+        """
+        return None
+
     def __call__(self, lines):
+        delimiter = self.delimiter
+        if self.encoding is not None and delimiter is not None:
+            delimiter = delimiter.encode(self.encoding)
         if self.process_line:
             lines = (self.process_line(x) for x in lines)
-        for line in lines:
-            vals = line.split(self.delimiter)
-            if self.process_val:
-                yield [self.process_val(x) for x in vals]
-            else:
+        return self._process_vals(line.split(delimiter) for line in lines)
+
+    def _process_vals(self, split_lines):
+        """Generator to apply ``process_val()`` to the needed values in each list
+        of ``split_lines``.  The default strip() is done inline since calling
+        the method for every value is a large part of the splitting time."""
+        process_val = self.process_val
+        col_indexes = self.col_indexes
+        if not process_val:
+            for vals in split_lines:
                 yield vals
+        elif col_indexes is not None:
+            if not _overrides(self, 'process_val', BaseSplitter):
+                process_val = lambda x: x.strip()
+            for vals in split_lines:
+                try:
+                    for i in col_indexes:
+                        vals[i] = process_val(vals[i])
+                except IndexError:
+                    # Too few values, which the reader reports as an inconsistent row
+                    pass
+                yield vals
+        elif not _overrides(self, 'process_val', BaseSplitter):
+            for vals in split_lines:
+                yield [x.strip() for x in vals]
+        else:
+            for vals in split_lines:
+                yield [process_val(x) for x in vals]
 
     def join(self, vals):
         if self.delimiter is None:
@@ -259,9 +625,19 @@ class DefaultSplitter(BaseSplitter):
         whitespace-delimited files to prevent spurious columns at the beginning or end.
         If splitting on whitespace then replace unquoted tabs with space first"""
         if self.delimiter == '\s':
-            line = _replace_tab_with_space(line, self.escapechar, self.quotechar)
+            if self.encoding is None or isinstance(line, unicode):
+                line = _replace_tab_with_space(line, self.escapechar, self.quotechar)
+            elif b'\t' in line:
+                line = _replace_tab_with_space(line.decode(self.encoding), self.escapechar,
+                                               self.quotechar).encode(self.encoding)
         return line.strip()
 
+    def supports_bytes(self):
+        """Return True if the splitter can split lines that are bytes.  This is
+        the case unless the line processing or splitting has been customized."""
+        return not any(getattr(self, x) is not None and _overrides(self, x, DefaultSplitter)
+                       for x in ('process_line', 'process_val', '__call__'))
+
     def __init__(self):
         self.csv_writer = None
         self.csv_writer_out = io.StringIO()
@@ -273,27 +649,150 @@ class DefaultSplitter(BaseSplitter):
         :param lines: list of table lines
         :returns: iterator
         """
-        if self.process_line:
-            lines = [self.process_line(x) for x in lines]
+        # The default line processing is done inline since calling the method
+        # for every line is a large part of the time.
+        process_line = self.process_line
+        if process_line and not _overrides(self, 'process_line', DefaultSplitter):
+            if self.delimiter != '\s':
+                lines = (x.strip() for x in lines)
+            elif self.encoding is None:
+                escapechar = self.escapechar
+                quotechar = self.quotechar
+                lines = (_replace_tab_with_space(x, escapechar, quotechar).strip() for x in lines)
+            else:
+                lines = (process_line(x) for x in lines)
+        elif process_line:
+            lines = (process_line(x) for x in lines)
 
         if self.delimiter == '\s':
             delimiter = ' '
         else:
             delimiter = self.delimiter
 
-        csv_reader = csv.reader(lines,
+        # The csv module is as fast as str.split() for str lines, but bytes
+        # lines are split without it where possible.
+        if self.encoding is not None:
+            split_lines = self._split_bytes(lines, delimiter)
+        else:
+            split_lines = csv.reader(lines,
+                                     delimiter = delimiter,
+                                     doublequote = self.doublequote,
+                                     escapechar =self.escapechar,
+                                     quotechar = self.quotechar,
+                                     quoting = self.quoting,
+                                     skipinitialspace = self.skipinitialspace
+                                     )
+        return self._process_vals(split_lines)
+
+    def split_numeric(self, lines):
+        """Split and convert all of the ``lines`` at once if every value is a
+        number and return a list with a numpy int or float array of the values
+        of each column, or None if the splitting is customized or a value is
+        not a number.
+
+        The lines are parsed as floats with one numpy.loadtxt() call, which
+        stops at the first value that is not a number or the first line with
+        a different number of values.  Columns of whole numbers are then
+        parsed again as ints so that the column types are the same as for
+        converting the split values one column at a time.
+
+        :param lines: sequence of lines to split
+        :returns: list of numpy arrays or None
+        """
+        if (not has_numpy or not self.supports_bytes() or
+            self.quoting == csv.QUOTE_NONNUMERIC):
+            return None
+        delimiter = None if self.delimiter == '\s' else self.delimiter
+        kwargs = dict(delimiter=delimiter, comments=None, ndmin=2,
+                      encoding=self.encoding)
+        try:
+            values = numpy.loadtxt(lines, dtype=float, **kwargs)
+        except ValueError:
+            return None
+
+        vals_cols = list(values.T)
+        int_cols = [i for i, x in enumerate(vals_cols) if numpy.all(numpy.floor(x) == x)]
+        if any(numpy.abs(vals_cols[i]).max() >= 2.0 ** 63 for i in int_cols):
+            # Too large for an int column, which fails to convert
+            return None
+
+        # numpy.loadtxt() only warns when it parses a value like 1.0 as an int
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            try:
+                if int_cols:
+                    ints = numpy.loadtxt(lines, dtype=int, usecols=int_cols, **kwargs)
+                    for i, int_vals in zip(int_cols, ints.T):
+                        vals_cols[i] = int_vals
+            except (ValueError, DeprecationWarning):
+                # Some column of whole numbers has a float value
+                for i in int_cols:
+                    try:
+                        ints = numpy.loadtxt(lines, dtype=int, usecols=[i], **kwargs)
+                        vals_cols[i] = ints[:, 0]
+                    except (ValueError, DeprecationWarning):
+                        pass
+
+        return vals_cols
+
+    def _split_bytes(self, lines, delimiter):
+        """Generator to split the bytes ``lines`` into lists of bytes values.
+        Lines without a quote or escape character are split with the bytes
+        split() method or a regex, which gives the same values as the csv
+        module for such lines.  Only the other lines are decoded and split
+        with the csv module."""
+        encoding = self.encoding
+        specials = [x.encode(encoding) for x in (self.quotechar, self.escapechar) if x]
+        if self.quoting == csv.QUOTE_NONE and self.quotechar:
+            specials = specials[1:]
+        if self.quoting == csv.QUOTE_NONNUMERIC:
+            has_special = lambda line: True
+        elif specials:
+            has_special = re.compile(b'|'.join(re.escape(x) for x in specials)).search
+        else:
+            has_special = lambda line: False
+        skipinitialspace = self.skipinitialspace
+        bytes_delimiter = delimiter.encode(encoding)
+        delimiter_space = bytes_delimiter + b' '
+        re_split = re.compile(re.escape(bytes_delimiter) + b' *').split
+
+        # Lines with special characters go through one csv reader, which reads
+        # any continuation lines of a quoted value from ``lines`` as well.
+        lines = iter(lines)
+        pending = []
+        def csv_lines():
+            while True:
+                if pending:
+                    yield pending.pop().decode(encoding)
+                else:
+                    for line in lines:
+                        yield line.decode(encoding)
+                        break
+                    else:
+                        return
+        csv_reader = csv.reader(csv_lines(),
                                 delimiter = delimiter,
                                 doublequote = self.doublequote,
-                                escapechar =self.escapechar,
+                                escapechar = self.escapechar,
                                 quotechar = self.quotechar,
                                 quoting = self.quoting,
-                                skipinitialspace = self.skipinitialspace
+                                skipinitialspace = skipinitialspace
                                 )
-        for vals in csv_reader:
-            if self.process_val:
-                yield [self.process_val(x) for x in vals]
+
+        for line in lines:
+            if has_special(line):
+                pending.append(line)
+                yield [x.encode(encoding) for x in next(csv_reader)]
+            elif not line:
+                yield []
+            elif skipinitialspace:
+                line = line.lstrip(b' ')
+                if delimiter_space in line:
+                    yield re_split(line)
+                else:
+                    yield line.split(bytes_delimiter)
             else:
-                yield vals
+                yield line.split(bytes_delimiter)
 
     def join(self, vals):
         if self.delimiter is None:
@@ -318,6 +817,18 @@ class DefaultSplitter(BaseSplitter):
 
 def _replace_tab_with_space(line, escapechar, quotechar):
     """Replace tab with space within ``line`` while respecting quoted substrings"""
+    if '\t' not in line:
+        return line
+    if not quotechar or quotechar not in line:
+        return line.replace('\t', ' ')
+    if escapechar is None or (escapechar not in line and escapechar != ' '):
+        # Every quotechar starts or ends a quoted substring, so the substrings
+        # outside of quotes are the even ones between quotechars.  (A space
+        # escapechar can come from a replaced tab.)
+        segments = line.split(quotechar)
+        segments[::2] = [x.replace('\t', ' ') for x in segments[::2]]
+        return quotechar.join(segments)
+
     newline = []
     in_quote = False
     lastchar = 'NONE'
@@ -330,6 +841,138 @@ def _replace_tab_with_space(line, escapechar, quotechar):
         newline.append(char)
     return ''.join(newline)
 
+_WHERE_OPS = {'<': operator.lt,
+              '<=': operator.le,
+              '>': operator.gt,
+              '>=': operator.ge,
+              '==': operator.eq,
+              '!=': operator.ne}
+
+def _compile_where(where, name_indexes, encoding=None):
+    """Return a tuple ``(func, indexes)`` for the data row selection ``where``
+    (see BaseData), where ``func`` is a function of the list of split values
+    of a row that returns True if the row is selected and ``indexes`` is the
+    set of indexes of the values that it uses (None for all values).
+
+    For a ``(name, op, value)`` tuple the column value is converted to float
+    if ``value`` is a number, and a row with a value that cannot be converted
+    is not selected.  A function gets the values decoded to str.
+
+    :param where: row selection
+    :param name_indexes: dict of the index in the split values of each column name
+    :param encoding: encoding of the split values if they are bytes
+    :returns: tuple (func, indexes)
+    """
+    if hasattr(where, '__call__'):
+        items = list(name_indexes.items())
+        if encoding is None:
+            func = lambda vals: where(dict((name, vals[i]) for name, i in items))
+        else:
+            func = lambda vals: where(dict((name, vals[i].decode(encoding)) for name, i in items))
+        return func, None
+
+    if isinstance(where, tuple):
+        where = [where]
+    tests = []
+    for condition in where:
+        try:
+            name, op, value = condition
+            op_func = _WHERE_OPS[op]
+        except (ValueError, TypeError, KeyError):
+            raise ValueError('where must be a function or (name, op, value) tuples with op one of %s'
+                             % ', '.join(sorted(_WHERE_OPS)))
+        if name not in name_indexes:
+            raise ValueError('where column %s not found in table' % name)
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            convert = float
+        else:
+            convert = lambda x: x
+            if encoding is not None and isinstance(value, unicode):
+                value = value.encode(encoding)
+        tests.append((name_indexes[name], op_func, convert, value))
+
+    def func(vals):
+        try:
+            for i, op_func, convert, value in tests:
+                if not op_func(convert(vals[i]), value):
+                    return False
+        except (ValueError, TypeError):
+            return False
+        return True
+    return func, set(x[0] for x in tests)
+
+# Number of rows of split values that are transposed into the columns at once
+# by _extend_str_vals()
+_TRANSPOSE_ROWS = 256
+
+def _extend_str_vals(cols, rows):
+    """Append the value of each of the ``cols`` in each list of split values
+    in ``rows`` to the column ``str_vals`` and return the number of rows.
+
+    If most of the values in a row are needed then blocks of rows are
+    transposed with zip() and each column is extended with its values at
+    once, which avoids a Python level append for every value.
+
+    :param cols: list of Column objects
+    :param rows: iterable of lists of split values
+    :returns: number of rows
+    """
+    n_rows = 0
+    rows = iter(rows)
+    while True:
+        block = list(itertools.islice(rows, _TRANSPOSE_ROWS))
+        if not block:
+            return n_rows
+        n_rows += len(block)
+        if len(cols) * 4 >= len(block[0]) * 3:
+            block_cols = list(zip(*block))
+            for col in cols:
+                col.str_vals.extend(block_cols[col.index])
+        else:
+            for str_vals in block:
+                for col in cols:
+                    col.str_vals.append(str_vals[col.index])
+
+# Classes of table lines (see _classify_lines())
+_BLANK_LINE = 0
+_COMMENT_LINE = 1
+_TABLE_LINE = 2
+
+def _comment_char(comment):
+    """Return a character that every line matching the ``comment`` regexp
+    contains if the regexp is that simple (e.g. ``#`` for ``\\s*#``), else None."""
+    match = re.match(r'\^?(?:\\s\*)?([^\\.^$*+?{}\[\]|()])(?![?*{])', comment)
+    if match and '|' not in comment:
+        return match.group(1)
+    return None
+
+def _classify_lines(lines, comment=None, encoding=None):
+    """Return a bytearray with the class of each of the table ``lines``, which
+    is _BLANK_LINE for a line of whitespace, _COMMENT_LINE for a line matching
+    the ``comment`` regexp and _TABLE_LINE for the other lines.  The comment
+    regexp is only matched to lines that contain its comment character (see
+    _comment_char()), if it has one.
+
+    :param lines: list of table lines
+    :param comment: regular expression for comment lines
+    :param encoding: encoding of the lines if they are bytes
+    :returns: bytearray
+    """
+    if not comment:
+        return bytearray([_TABLE_LINE if x.strip() else _BLANK_LINE for x in lines])
+
+    char = _comment_char(comment)
+    if encoding is not None:
+        comment = comment.encode(encoding)
+        if char is not None:
+            char = char.encode(encoding)
+    match = re.compile(comment).match
+    if char is None:
+        return bytearray([_BLANK_LINE if not x.strip() else _COMMENT_LINE if match(x)
+                          else _TABLE_LINE for x in lines])
+    return bytearray([_BLANK_LINE if not x.strip() else _COMMENT_LINE if char in x and match(x)
+                      else _TABLE_LINE for x in lines])
+
 def _get_line_index(line_or_func, lines):
     """Return the appropriate line index, depending on ``line_or_func`` which
     can be either a function, a positive or negative int, or None.
@@ -341,7 +984,10 @@ def _get_line_index(line_or_func, lines):
         if line_or_func >= 0:
             return line_or_func
         else:
-            n_lines = sum(1 for line in lines)
+            try:
+                n_lines = len(lines)
+            except TypeError:
+                n_lines = sum(1 for line in lines)
             return n_lines + line_or_func
     else:
         return line_or_func
@@ -417,9 +1063,19 @@ class BaseHeader(object):
         self._set_cols_from_names()
 
     def process_lines(self, lines):
-        """Generator to yield non-comment lines"""
+        """Generator to yield non-comment lines.  If the data have already
+        classified ``lines`` with the same comment regexp then only the lines
+        of whitespace need to be matched."""
         if self.comment:
             re_comment = re.compile(self.comment)
+        line_classes = self.data.get_line_classes(lines, self.comment) if hasattr(self, 'data') else None
+        if line_classes is not None:
+            for line, line_class in zip(lines, line_classes):
+                if line_class == _TABLE_LINE or (line_class == _BLANK_LINE and line and
+                                                 (not self.comment or not re_comment.match(line))):
+                    yield line
+            return
+
         # Yield non-comment lines
         for line in lines:
             if line and (not self.comment or not re_comment.match(line)):
@@ -472,10 +1128,20 @@ class BaseData(object):
     :param end_line: None, int, or a function of ``lines`` that returns None or int
     :param comment: Regular expression for comment lines
     :param splitter_class: Splitter class for splitting data lines into columns
+    :param nrows: None or maximum number of data rows to read
+    :param skiprows: number of data rows to skip before reading
+    :param encoding: encoding of the data lines if they are bytes (set by the reader)
+    :param numeric: True if all data values are numbers, False to always split and convert the values one column at a time, or None to check
+    :param where: None, a function of a dict of the row values keyed on column name, or a ``(name, op, value)`` tuple or list of tuples that selects the data rows to read
     """
     start_line = None
     end_line = None
+    nrows = None
+    skiprows = 0
+    numeric = None
+    where = None
     comment = None
+    encoding = None
     splitter_class = DefaultSplitter
     write_spacer_lines = ['ASCIITABLE_WRITE_SPACER_LINE']
     formats = {}
@@ -483,22 +1149,57 @@ class BaseData(object):
     fill_values = []
     fill_include_names = None
     fill_exclude_names = None
+    _line_classes = (None, None, None)
 
     def __init__(self):
         self.splitter = self.__class__.splitter_class()
 
     def process_lines(self, lines):
-        """Strip out comment lines and blank lines from list of ``lines``
+        """Strip out comment lines and blank lines from list of ``lines``.
+        The lines are classified in one pass (see get_line_classes()).
 
         :param lines: all lines in table
-        :returns: list of lines
+        :returns: list of lines (or MmapLines for MmapLines ``lines``)
         """
-        nonblank_lines = (x for x in lines if x.strip())
-        if self.comment:
-            re_comment = re.compile(self.comment)
-            return [x for x in nonblank_lines if not re_comment.match(x)]
+        if not isinstance(lines, (list, MmapLines)):
+            lines = list(lines)
+        # The header processing may pass decoded lines even if the data lines are bytes
+        if self.encoding is not None and lines and not isinstance(lines[0], unicode):
+            encoding = self.encoding
         else:
-            return [x for x in nonblank_lines]
+            encoding = None
+        line_classes = _classify_lines(lines, self.comment, encoding)
+        self._line_classes = (lines, self.comment, line_classes)
+        table_lines = line_classes.replace(bytearray([_COMMENT_LINE]), bytearray([_BLANK_LINE]))
+        if isinstance(lines, MmapLines):
+            return lines.compress(table_lines)
+        return list(itertools.compress(lines, table_lines))
+
+    def get_line_classes(self, lines, comment):
+        """Return the classes of the table ``lines`` (see _classify_lines()) if
+        they were found by the last call of process_lines() with the same
+        ``lines`` and the ``comment`` regexp was the same, else None.  This
+        lets the header and ``comment_lines`` use the classes without another
+        pass over the lines.  The classes are dropped once the data lines are
+        split, unless they are for the input lines kept by read(), and then
+        once ``comment_lines`` has used them.
+
+        :param lines: all lines in table
+        :param comment: regular expression for comment lines
+        :returns: bytearray or None
+        """
+        classified_lines, classified_comment, line_classes = self._line_classes
+        if (classified_lines is lines and classified_comment == comment and
+            len(line_classes) == len(lines)):
+            return line_classes
+        return None
+
+    def _compile_comment(self, text=False):
+        """Return the compiled ``comment`` regexp for matching the data lines,
+        which are bytes if ``encoding`` is set unless ``text`` is True."""
+        if self.encoding is not None and not text:
+            return re.compile(self.comment.encode(self.encoding))
+        return re.compile(self.comment)
 
     def get_data_lines(self, lines):
         """Set the ``data_lines`` attribute to the lines slice comprising the
@@ -508,10 +1209,47 @@ class BaseData(object):
         end_line = _get_line_index(self.end_line, data_lines)
 
         if start_line is not None or end_line is not None:
-            self.data_lines = data_lines[slice(start_line, end_line)]
-        else:  # Don't copy entire data lines unless necessary
+            self.data_lines = _slice_lines(data_lines, start_line, end_line)
+        else:
             self.data_lines = data_lines
 
+    def iter_data_lines(self, lines):
+        """Generator to yield the same lines as ``data_lines`` after a call to
+        get_data_lines(), but processing ``lines`` incrementally.
+
+        This is only possible for the standard line processing with an int or
+        None ``start_line`` and ``end_line``.  Otherwise get_data_lines() is
+        called and all data lines are held in memory.
+
+        :param lines: iterable of all lines in table
+        """
+        start_line = self.start_line
+        end_line = self.end_line
+        if (_overrides(self, 'process_lines', BaseData) or
+            hasattr(start_line, '__call__') or hasattr(end_line, '__call__') or
+            (start_line is not None and start_line < 0)):
+            if not hasattr(lines, '__getitem__'):
+                lines = list(lines)
+            self.get_data_lines(lines)
+            for line in self.data_lines:
+                yield line
+            return
+
+        data_lines = (x for x in lines if x.strip())
+        if self.comment:
+            re_comment = self._compile_comment()
+            data_lines = (x for x in data_lines if not re_comment.match(x))
+
+        data_lines = itertools.islice(data_lines, start_line or 0, None)
+        if end_line is not None:
+            if end_line < 0:
+                data_lines = _drop_last(data_lines, -end_line)
+            else:
+                data_lines = itertools.islice(data_lines, max(end_line - (start_line or 0), 0))
+
+        for line in data_lines:
+            yield line
+
     def get_str_vals(self):
         """Return a generator that returns a list of column values (as strings)
         for each data line."""
@@ -560,18 +1298,73 @@ class BaseData(object):
                 else:
                     affect_cols = replacement[2:]
 
+                bad_value = replacement[0]
+                fill_value = str(replacement[1])
                 for i, key in ((i, x) for i, x in enumerate(self.header.colnames) if x in affect_cols):
-                    cols[i].fill_values[replacement[0]] = str(replacement[1])
+                    cols[i].fill_values[bad_value] = fill_value
+
+            # Step 2b: Encode the fill values of the columns whose values are bytes
+            for col in cols:
+                if col.fill_values and col.encoding is not None:
+                    self._encode_fill_values(col)
+
+    @staticmethod
+    def _encode_fill_values(col):
+        """Encode the bad and fill values of ``col`` to match its bytes values,
+        or decode the values of ``col`` if a fill value cannot be encoded (e.g.
+        a non-ASCII value for a column split as ASCII bytes)."""
+        encoding = col.encoding
+        try:
+            col.fill_values = dict((bad_value.encode(encoding), fill_value.encode(encoding))
+                                   for bad_value, fill_value in col.fill_values.items())
+        except UnicodeEncodeError:
+            BaseOutputter._decode_str_vals(col)
 
     def _set_masks(self, cols):
-        """Replace string values in col.str_vales and set masks"""
+        """Replace string values in col.str_vals and set masks.  With numpy
+        the bad values of each column are found at once and ``col.mask`` is a
+        numpy bool array (see _set_mask_numpy()), else it is a list."""
         if self.fill_values:
             for col in (col for col in cols if col.fill_values):
+                if has_numpy:
+                    self._set_mask_numpy(col)
+                    continue
                 col.mask = [False] * len(col.str_vals)
                 for i, str_val in ((i, x) for i, x in enumerate(col.str_vals) if x in col.fill_values):
                     col.str_vals[i] = col.fill_values[str_val]
                     col.mask[i] = True
 
+    @staticmethod
+    def _set_mask_numpy(col):
+        """Replace the bad values in ``col.str_vals`` by their fill values and
+        set ``col.mask`` to a numpy bool array.  If the values are a numpy
+        bytes array (see BaseReader._split_columns()) then the bad values are
+        found with one vectorized membership test and replaced in the array,
+        which is widened if a fill value is longer than the values.  Only the
+        bad values of a list are replaced one by one."""
+        str_vals = col.str_vals
+        fill_values = col.fill_values
+        if isinstance(str_vals, numpy.ndarray):
+            mask = numpy.in1d(str_vals, list(fill_values))
+        else:
+            mask = numpy.fromiter((x in fill_values for x in str_vals), bool, len(str_vals))
+        bad_indexes = numpy.flatnonzero(mask)
+
+        if isinstance(str_vals, numpy.ndarray):
+            if len(bad_indexes):
+                dtype = numpy.promote_types(str_vals.dtype,
+                                            numpy.array(list(fill_values.values())).dtype)
+                if dtype != str_vals.dtype:
+                    str_vals = str_vals.astype(dtype)
+                bad_vals = str_vals[bad_indexes]
+                for bad_value, fill_value in fill_values.items():
+                    str_vals[bad_indexes[bad_vals == bad_value]] = fill_value
+                col.str_vals = str_vals
+        else:
+            for i in bad_indexes:
+                str_vals[i] = fill_values[str_vals[i]]
+        col.mask = mask
+
     def write(self, lines):
         if hasattr(self.start_line, '__call__'):
             raise TypeError('Start_line attribute cannot be callable for write()')
@@ -649,6 +1442,105 @@ class DictLikeNumpy(dict):
     def next(self):
         return self.__next__()
 
+class LazyTable(DictLikeNumpy):
+    """Table from the LazyOutputter with the same interface as DictLikeNumpy,
+    where each column is converted only when it is first accessed and then
+    kept::
+
+      table = asciitable.read('survey.dat', Outputter=asciitable.LazyOutputter, guess=False)
+      table.dtype.names   # column names in order (nothing is converted)
+      table['col1']       # converts column col1
+      table[1]            # converts all columns and returns row 1 as a list
+
+    :param cols: list of Column objects with the table values
+    :param convert_col: function that returns the output values of a Column
+    """
+    def __init__(self, cols, convert_col):
+        DictLikeNumpy.__init__(self)
+        self.dtype.names = tuple(x.name for x in cols)
+        self._cols = dict((x.name, x) for x in cols)
+        self._convert_col = convert_col
+        self._n_rows = 0
+        if cols:
+            col = cols[0]
+            self._n_rows = len(col.data) if hasattr(col, 'data') else len(col.str_vals)
+
+    def __getitem__(self, item):
+        try:
+            name = item + ''
+        except TypeError:
+            return [self[x][item] for x in self.dtype.names]
+        if not dict.__contains__(self, name):
+            dict.__setitem__(self, name, self._convert_col(self._cols[name]))
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return name in self._cols
+
+    def __repr__(self):
+        return '<LazyTable with columns (%s) and %d rows>' % (', '.join(self.dtype.names),
+                                                              self._n_rows)
+
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
+    def convert_all(self):
+        """Convert all of the columns that have not been accessed yet."""
+        for name in self.dtype.names:
+            self[name]
+
+    def __len__(self):
+        return self._n_rows
+
+    def keys(self):
+        return list(self.dtype.names)
+
+    def values(self):
+        return [self[x] for x in self.dtype.names]
+
+    def items(self):
+        return [(x, self[x]) for x in self.dtype.names]
+
+def _concatenate_tables(tables):
+    """Join the output ``tables`` (all numpy or all DictLikeNumpy) into one table."""
+    if not tables:
+        return None
+    names = tables[0].dtype.names
+    for table in tables[1:]:
+        if table.dtype.names != names:
+            raise ValueError('Cannot concatenate tables with column names %s and %s'
+                             % (names, table.dtype.names))
+
+    if not isinstance(tables[0], DictLikeNumpy):
+        arrays = []
+        for name in names:
+            cols = [x[name] for x in tables]
+            if len(set(x.dtype.kind in 'SU' for x in cols)) > 1:
+                raise ValueError('Cannot concatenate column %s with both number and string values'
+                                 % name)
+            if any(isinstance(x, numpy.ma.MaskedArray) for x in cols):
+                arrays.append(numpy.ma.concatenate(cols))
+            else:
+                arrays.append(numpy.concatenate(cols))
+        recarr = numpy.rec.fromarrays(arrays, names=names)
+        if any(isinstance(x, numpy.ma.MaskedArray) for x in arrays):
+            maarr = recarr.view(numpy.ma.MaskedArray)
+            for name, array in zip(names, arrays):
+                maarr[name] = numpy.ma.masked_where(numpy.ma.getmaskarray(array), maarr[name])
+            return maarr
+        return recarr
+
+    table = DictLikeNumpy()
+    for name in names:
+        vals = []
+        for x in tables:
+            vals.extend(x[name])
+        table[name] = vals
+    table.dtype.names = names
+    return table
+
 def convert_list(python_type):
     """Return a tuple ``(converter_func, converter_type)``.  The converter
     function converts a list into a list of the given ``python_type``.  This
@@ -691,6 +1583,9 @@ def convert_numpy(numpy_type):
         return numpy.array(vals, numpy_type)
     return converter, converter_type
 
+# Number of values that are converted at once by NumpyOutputter._convert_inferred()
+_CONVERT_ROWS = 8192
+
 class BaseOutputter(object):
     """Output table as a dict of column objects keyed on column name.  The
     table data are stored as plain python lists within the column objects.
@@ -731,11 +1626,25 @@ class BaseOutputter(object):
                                              self.default_converters)
             col.converters = self._validate_and_copy(col, converters)
 
+            # Bytes values are converted directly by the default numeric converters
+            # and are otherwise decoded first.  Custom converters always get a
+            # list of str, also for the numpy arrays of a column-wise split.
+            if converters is not self.default_converters:
+                if col.encoding is not None:
+                    self._decode_str_vals(col)
+                if has_numpy and isinstance(col.str_vals, numpy.ndarray):
+                    col.str_vals = col.str_vals.tolist()
+
+            if converters is type(self).default_converters:
+                self._convert_inferred(col)
+
             while not hasattr(col, 'data'):
                 try:
                     converter_func, converter_type = col.converters[0]
                     if not issubclass(converter_type, col.type):
                         raise TypeError()
+                    if col.encoding is not None and issubclass(converter_type, StrType):
+                        self._decode_str_vals(col)
                     col.data = converter_func(col.str_vals)
                     col.type = converter_type
                 except (TypeError, ValueError):
@@ -743,13 +1652,32 @@ class BaseOutputter(object):
                 except IndexError:
                     raise ValueError('Column %s failed to convert' % col.name)
 
+    def _convert_inferred(self, col):
+        """Convert ``col.str_vals`` with the default converters using a single
+        pass over the values, or leave ``col.data`` unset to try each converter
+        on the whole column.  This does nothing here since re-converting
+        python lists costs as much as parsing the strings (see
+        NumpyOutputter._convert_inferred())."""
+
+    @staticmethod
+    def _decode_str_vals(col):
+        """Decode the bytes ``col.str_vals`` to str."""
+        encoding = col.encoding
+        if has_numpy and isinstance(col.str_vals, numpy.ndarray):
+            col.str_vals = numpy.char.decode(col.str_vals, encoding)
+        else:
+            col.str_vals = [x.decode(encoding) for x in col.str_vals]
+        col.encoding = None
+
 class NumpyOutputter(BaseOutputter):
     """Output the table as a numpy.rec.recarray
 
     Missing or bad data values are handled at two levels.  The first is in
     the data reading step where if ``data.fill_values`` is set then any
     occurences of a bad value are replaced by the correspond fill value.
-    At the same time a boolean list ``mask`` is created in the column object.
+    At the same time a boolean ``mask`` (a numpy bool array when numpy is
+    available) is created in the column object, and the masks of all the
+    columns are then used to build the masked array at once.
 
     The second stage is when converting to numpy arrays which by default generates
     masked arrays, if ``data.fill_values`` is set and plain arrays if it is not.
@@ -770,30 +1698,128 @@ class NumpyOutputter(BaseOutputter):
       Outputter = asciitable.NumpyOutputter()
       Outputter.default_masked = True
 
+    With the default converters each column is converted in one pass over
+    its values.  If ``infer_rows`` is set then the type of each column is
+    instead inferred from the first ``infer_rows`` values and as many values
+    spread over the rest of the column, and the column is then converted
+    at once with that type (see _infer_converter()).
+
     """
 
     auto_masked_array = True
     default_masked_array = False
+    infer_rows = None
 
     if has_numpy:
         default_converters = [convert_numpy(numpy.int),
                               convert_numpy(numpy.float),
                               convert_numpy(numpy.str)]
 
+    def _convert_inferred(self, col):
+        """Convert ``col.str_vals`` with the first numeric converter in
+        ``col.converters`` that works for every value, with one pass over the
+        values.  The values are converted in blocks and when a block fails the
+        next converter is tried from that block on, after converting the
+        blocks already done from their numbers (e.g. int to float) instead of
+        from the strings.  If a non-numeric converter is reached then
+        ``col.data`` is left unset for _convert_vals() to convert the whole
+        column.  The result is the same as trying each converter on the whole
+        column, as is done for user supplied converters.  If ``infer_rows``
+        is set then _infer_converter() is used instead."""
+        if self.infer_rows is not None:
+            self._infer_converter(col)
+            return
+
+        str_vals = col.str_vals
+        blocks = []
+        blocks_type = None
+        start = 0
+        while start < len(str_vals) and col.converters:
+            converter_func, converter_type = col.converters[0]
+            if not issubclass(converter_type, NumType):
+                return
+            try:
+                if not issubclass(converter_type, col.type):
+                    raise TypeError()
+                if converter_type is not blocks_type:
+                    blocks = [converter_func(x) for x in blocks]
+                    blocks_type = converter_type
+                blocks.append(converter_func(str_vals[start:start + _CONVERT_ROWS]))
+                start += _CONVERT_ROWS
+            except (TypeError, ValueError):
+                col.converters.pop(0)
+
+        if blocks and start >= len(str_vals):
+            col.data = numpy.concatenate(blocks)
+            col.type = blocks_type
+
+    def _infer_converter(self, col):
+        """Remove the numeric converters from the start of ``col.converters``
+        which fail for a sample of ``col.str_vals``, namely the first
+        ``infer_rows`` values plus ``infer_rows`` values evenly spread over the
+        rest of the column.  _convert_vals() then converts the whole column
+        with the first converter left, so usually there is just one conversion,
+        and tries the next converter only if a value outside the sample fails."""
+        str_vals = col.str_vals
+        n_rows = self.infer_rows
+        sample = str_vals[:n_rows]
+        if n_rows > 0 and len(str_vals) > 2 * n_rows:
+            step = (len(str_vals) - n_rows) // n_rows
+            if isinstance(str_vals, numpy.ndarray):
+                sample = numpy.concatenate((sample, str_vals[n_rows::step]))
+            else:
+                sample = sample + str_vals[n_rows::step]
+
+        while col.converters:
+            converter_func, converter_type = col.converters[0]
+            if not issubclass(converter_type, NumType):
+                return
+            try:
+                if not issubclass(converter_type, col.type):
+                    raise TypeError()
+                converter_func(sample)
+                return
+            except (TypeError, ValueError):
+                col.converters.pop(0)
+
     def __call__(self, cols):
         self._convert_vals(cols)
         recarr = numpy.rec.fromarrays([x.data for x in cols], names=[x.name for x in cols])
         if self.default_masked_array or (self.auto_masked_array and
                                          any(col.fill_values for col in cols)):
-            maarr = recarr.view(numpy.ma.MaskedArray)
+            mask = numpy.ma.make_mask_none(recarr.shape, recarr.dtype)
             for col in cols:
                 if col.fill_values:
-                    maarr[col.name] = numpy.ma.masked_where(col.mask, maarr[col.name])
-            return maarr
+                    mask[col.name] = col.mask
+            return numpy.ma.MaskedArray(recarr, mask=mask)
         else:
             return recarr
 
 
+class LazyOutputter(NumpyOutputter):
+    """Output the table as a LazyTable where each column is converted to a
+    numpy array (or masked array, as for the NumpyOutputter) only when it is
+    first accessed.  This saves the conversion of the columns that are never
+    used in a wide table.  An all-numeric table that is parsed with one
+    numpy.loadtxt() call (see ``numeric``) is converted at once anyway, and
+    so is every table whose format is guessed, since a wrong guess is only
+    found by converting the columns.
+    """
+
+    def __call__(self, cols):
+        masked = self.default_masked_array or (self.auto_masked_array and
+                                               any(col.fill_values for col in cols))
+
+        def convert_col(col):
+            self._convert_vals([col])
+            if not masked:
+                return col.data
+            mask = col.mask if col.fill_values else numpy.zeros(len(col.data), dtype=bool)
+            return numpy.ma.MaskedArray(col.data, mask=mask)
+
+        return LazyTable(cols, convert_col)
+
+
 class BaseReader(object):
     """Class providing methods to read an ASCII table using the specified
     header, data, inputter, and outputter instances.
@@ -807,6 +1833,9 @@ class BaseReader(object):
     The default behavior is to raise an InconsistentTableError.
 
     """
+    # Header columns that are split, including any only needed by ``data.where``
+    _split_cols = None
+
     def __init__(self):
         self.header = BaseHeader()
         self.data = BaseData()
@@ -835,6 +1864,265 @@ class BaseReader(object):
         :param table: table input
         :returns: output table
         """
+        self._prepare_read(table)
+
+        # Stream the input so that reading stops once the requested rows are found
+        _check_row_counts(self.data.nrows, self.data.skiprows)
+        skiprows = self.data.skiprows or 0
+        if skiprows or self.data.nrows is not None:
+            if self.data.nrows is None:
+                stop = None
+            else:
+                stop = skiprows + self.data.nrows
+            return self.read_rows(table, slice(skiprows, stop))
+
+        self.lines = self.inputter.get_lines(table)
+        self.data.get_data_lines(self.lines)
+        self._get_cols(self._decoded(self.lines))
+        self._set_splitter_cols()
+        self._set_cols_encoding()
+
+        return self._read_data()
+
+    def read_rows(self, table, rows):
+        """Read only the data rows of ``table`` selected by the slice ``rows``
+        and return them in a format determined by the ``outputter`` attribute.
+
+        The table lines are streamed as for iter_chunks() and the data lines
+        outside of ``rows`` are skipped before they are split or converted.
+        Reading stops once the last requested row has been read.  The slice
+        start and stop must not be negative.
+
+        :param table: table input
+        :param rows: slice selecting the data rows (first data row has index 0, no negative values)
+        :returns: output table
+        """
+        _check_rows(rows)
+        self._prepare_read(table)
+        lines = self._stream_lines(table, keep_lines=True)
+        self.data.data_lines = itertools.islice(self.data.data_lines, rows.start,
+                                                rows.stop, rows.step)
+        table = self._read_data()
+        self.lines = lines._cache       # Only the lines actually read
+
+        return table
+
+    def _read_data(self):
+        """Split and convert the data lines of the table, which has already
+        been set up by read() or read_rows(), and return the output table."""
+        # The line classes are only needed for the header processing and then
+        # for comment_lines, which uses them only for the kept input lines
+        if self.data._line_classes[0] is not getattr(self, 'lines', None):
+            self.data._line_classes = BaseData._line_classes
+        cols = self.header.cols         # header.cols corresponds to *output* columns requested
+        vals_cols = self._split_numeric()
+        str_cols = None if vals_cols is not None else self._split_columns()
+        if vals_cols is not None:
+            for col in cols:
+                col.data = vals_cols[col.index]
+                col.type = IntType if col.data.dtype.kind == 'i' else FloatType
+        elif str_cols is not None:
+            for col in cols:
+                col.str_vals = str_cols[col.index]
+                col.encoding = self.data.encoding or 'ascii'
+        else:
+            _extend_str_vals(cols, self._iter_str_vals())
+
+        self.data.masks(cols)
+        self.table = self.outputter(cols)
+        self.cols = self.header.cols
+
+        return self.table
+
+    def _split_numeric(self):
+        """Split and convert the data lines into a numpy int or float array for
+        each column at once if all of the values are numbers (see
+        BaseSplitter.split_numeric()), else return None.  Unless
+        ``data.numeric`` is True the first data line is checked before the
+        others.  The arrays are only used by the NumpyOutputter with the
+        default converters, when no fill values need to be replaced, when no
+        rows are selected with ``data.where`` and when the array types match
+        the header column types."""
+        outputter = self.outputter
+        cols = self.header.cols
+        if (not has_numpy or self.data.numeric is False or self.data.where is not None or
+            not isinstance(outputter, NumpyOutputter) or self.data.fill_values or
+            outputter.default_converters is not NumpyOutputter.default_converters or
+            any(col.name in outputter.converters or not issubclass(FloatType, col.type)
+                for col in cols)):
+            return None
+        lines = self._get_data_lines()
+        if not lines:
+            return None
+
+        splitter = self.data.splitter
+        if not self.data.numeric and splitter.split_numeric(lines[:1]) is None:
+            return None
+        vals_cols = splitter.split_numeric(lines)
+        if vals_cols is None or len(vals_cols) != self.header.n_data_cols:
+            return None
+
+        for col in cols:
+            vals = vals_cols[col.index]
+            if vals.dtype.kind == 'i' and not issubclass(IntType, col.type):
+                vals_cols[col.index] = vals.astype(float)
+        return vals_cols
+
+    def _split_columns(self):
+        """Split the data lines into a numpy bytes array for each column at
+        once if the splitter supports that (see BaseSplitter.split_columns()),
+        else return None.  The arrays are only used by the NumpyOutputter and
+        when no rows are selected with ``data.where``."""
+        if (not has_numpy or not isinstance(self.outputter, NumpyOutputter)
+            or self.data.where is not None or
+            not _overrides(self.data.splitter, 'split_columns', BaseSplitter)):
+            return None
+        lines = self._get_data_lines()
+        if not lines:
+            return None
+        return self.data.splitter.split_columns(lines)
+
+    def _get_data_lines(self):
+        """Return ``data.data_lines`` as a sequence.  If it is an iterator (as
+        set by read_rows()) then it is first stored as a list."""
+        if not hasattr(self.data.data_lines, '__len__'):
+            self.data.data_lines = list(self.data.data_lines)
+        return self.data.data_lines
+
+    def iter_chunks(self, table, chunk_rows=10000):
+        """Read the ``table`` incrementally and return a generator of output
+        tables with at most ``chunk_rows`` rows each.  The output format of each
+        chunk is determined by the ``outputter`` attribute.
+
+        The header is parsed once and then the data lines are read, split and
+        converted one chunk at a time so that the memory needed is set by
+        ``chunk_rows`` instead of the table size.  The column types found for
+        the first chunk are pinned and used for all subsequent chunks.  If a
+        column needs a wider type further into the table (e.g. float after int)
+        then converting that chunk raises InconsistentTableError naming the
+        column and data row and the ``converters`` that read it, so in that
+        case set the column type with ``outputter.converters``.
+
+        Tables whose line processing needs all of the lines at once (for
+        instance a callable ``data.start_line``) can still be read this way but
+        the table lines are then held in memory.
+
+        :param table: table input
+        :param chunk_rows: maximum number of data rows in each chunk
+        :returns: generator of output tables
+        """
+        if chunk_rows < 1:
+            raise ValueError('chunk_rows must be a positive integer')
+
+        self._prepare_read(table)
+        self._stream_lines(table)
+
+        return self._iter_chunks(chunk_rows)
+
+    def _stream_lines(self, table, keep_lines=False, lines=None):
+        """Parse the header of ``table`` and set ``data.data_lines`` to an
+        iterator over the data lines that reads the input as it goes.  If
+        ``keep_lines`` is True then the input lines that are read are all kept
+        in the returned line buffer instead of only those needed by the header.
+        If ``lines`` is given then it is used as the iterator over the table
+        lines instead of reading ``table`` with the inputter.
+        """
+        if lines is None:
+            lines = self.inputter.iter_lines(table)
+        lines = _LineBuffer(lines)
+        if keep_lines:
+            data_lines = _LineBuffer(self.data.iter_data_lines(iter(lines)))
+        else:
+            data_lines = _LineBuffer(self.data.iter_data_lines(lines.drain()))
+        # The header may need the first data line to auto-generate column names
+        self.data.data_lines = data_lines
+        self._get_cols(self._decoded(lines))
+        self.data.data_lines = data_lines.drain()
+        self._set_splitter_cols()
+        self._set_cols_encoding()
+
+        return lines
+
+    def _iter_chunks(self, chunk_rows):
+        col_types = None
+        first_row = 0
+        str_vals_iter = self._iter_str_vals()
+        while True:
+            # Each chunk gets fresh copies of the header columns
+            cols = []
+            for i, header_col in enumerate(self.header.cols):
+                col = copy.copy(header_col)
+                col.str_vals = []
+                col.fill_values = {}
+                if col_types is not None:
+                    col.type = col_types[i]
+                cols.append(col)
+
+            n_rows = _extend_str_vals(cols, itertools.islice(str_vals_iter, chunk_rows))
+            if n_rows == 0:
+                break
+
+            self.data.masks(cols)
+            try:
+                self.table = self.outputter(cols)
+            except ValueError:
+                if col_types is not None:
+                    self._check_chunk_types(cols, first_row)
+                raise
+            self.cols = cols
+            col_types = [col.type for col in cols]
+            first_row += n_rows
+            yield self.table
+
+            if n_rows < chunk_rows:
+                break
+
+    def _check_chunk_types(self, cols, first_row):
+        """Raise InconsistentTableError for the first value in the chunk
+        ``cols`` (starting at data row ``first_row``) that cannot be converted
+        to its column type from the first chunk."""
+        outputter = self.outputter
+        for col in cols:
+            if hasattr(col, 'data'):
+                continue
+            converters = outputter._validate_and_copy(
+                col, outputter.converters.get(col.name, outputter.default_converters))
+            for i, val in enumerate(col.str_vals):
+                for converter_func, converter_type in converters:
+                    try:
+                        converter_func([val])
+                        break
+                    except (TypeError, ValueError):
+                        pass
+                else:
+                    if isinstance(val, bytes) and col.encoding is not None:
+                        val = val.decode(col.encoding)
+                    raise InconsistentTableError(
+                        'Column %s value %r in data row %d does not fit the %s column '
+                        'type found for the first chunk; to read it pass %s'
+                        % (col.name, val, first_row + i, col.type.__name__,
+                           self._get_chunk_converters_hint(col.name, val)))
+
+    def _get_chunk_converters_hint(self, name, val):
+        """Return the ``converters`` argument that sets the column ``name`` to
+        the narrowest type of the default converters that fits ``val``."""
+        py_types = ((IntType, 'int'), (FloatType, 'float'), (StrType, 'str'))
+        py_type = 'str'
+        for converter_func, converter_type in self.outputter.default_converters:
+            try:
+                converter_func([val])
+            except (TypeError, ValueError):
+                continue
+            py_type = [x[1] for x in py_types if issubclass(converter_type, x[0])][0]
+            break
+        if isinstance(self.outputter, NumpyOutputter):
+            convert = 'convert_numpy'
+        else:
+            convert = 'convert_list'
+        return 'converters={%r: [asciitable.%s(%s)]}' % (name, convert, py_type)
+
+    def _prepare_read(self, table):
+        """Set up the header and data objects prior to reading ``table``."""
         # If ``table`` is a file then store the name in the ``data``
         # attribute. The ``table`` is a "file" if it is a string
         # without the new line specific to the OS.
@@ -849,12 +2137,109 @@ class BaseReader(object):
         self.data.header = self.header
         self.header.data = self.data
 
-        self.lines = self.inputter.get_lines(table)
-        self.data.get_data_lines(self.lines)
-        self.header.get_cols(self.lines)
-        cols = self.header.cols         # header.cols corresponds to *output* columns requested
+        # With an input encoding the data lines are processed and split as
+        # bytes where possible, and then only string columns are decoded.
+        binary = (self.inputter.encoding is not None and str is not bytes and
+                  not _overrides(self.inputter, 'process_lines', BaseInputter) and
+                  not _overrides(self.data, 'process_lines', BaseData) and
+                  not hasattr(self.data.start_line, '__call__') and
+                  not hasattr(self.data.end_line, '__call__') and
+                  self.data.splitter.supports_bytes())
+        self.inputter.binary = binary
+        if binary:
+            encoding = self.inputter.encoding
+        else:
+            encoding = None
+        self.data.encoding = encoding
+        self.data.splitter.encoding = encoding
+
+    def _decoded(self, lines):
+        """Return the table ``lines`` as str for the header processing."""
+        if self.data.encoding is None:
+            return lines
+        return _DecodedLines(lines, self.data.encoding)
+
+    def _get_cols(self, lines):
+        """Set the header columns from the table ``lines`` with header.get_cols().
+        The columns used by ``data.where`` are included even if they are not
+        in ``include_names`` (or are in ``exclude_names``), since readers like
+        FixedWidth only split the header columns.  These columns are kept in
+        ``_split_cols`` and left out of ``header.cols``, so they are split for
+        selecting the rows but not converted or output."""
+        header = self.header
+        where = self.data.where
+        include_names = header.include_names
+        exclude_names = header.exclude_names
+        self._split_cols = None
+        if where is None or (include_names is None and exclude_names is None):
+            header.get_cols(lines)
+            return
+
+        if hasattr(where, '__call__'):
+            # The function gets the values of all of the columns
+            header.include_names = None
+            header.exclude_names = None
+        else:
+            try:
+                where_names = set(x[0] for x in ([where] if isinstance(where, tuple) else where))
+            except (TypeError, IndexError):
+                where_names = set()     # Invalid where is reported by _compile_where()
+            if include_names is not None:
+                header.include_names = list(include_names) + sorted(where_names)
+            if exclude_names is not None:
+                header.exclude_names = [x for x in exclude_names if x not in where_names]
+        try:
+            header.get_cols(lines)
+        finally:
+            header.include_names = include_names
+            header.exclude_names = exclude_names
+
+        self._split_cols = header.cols
+        header.cols = [x for x in header.cols
+                       if (include_names is None or x.name in include_names) and
+                       (exclude_names is None or x.name not in exclude_names)]
+
+    def _set_splitter_cols(self):
+        """Give the data splitter the header columns and, if only some of the
+        split values are needed, their indexes.  All values are processed if
+        inconsistent_handler() is overridden since it may move values."""
+        cols = self.header.cols
+        splitter = self.data.splitter
+        splitter.cols = self._split_cols or cols
+        where_indexes = self._get_where()[1]
+        if (len(cols) < self.header.n_data_cols and where_indexes is not None and
+            not _overrides(self, 'inconsistent_handler', BaseReader)):
+            splitter.col_indexes = sorted(set(col.index for col in cols) | where_indexes)
+        else:
+            splitter.col_indexes = None
+
+    def _get_where(self):
+        """Return the tuple ``(func, indexes)`` for selecting data rows with
+        ``data.where`` (see _compile_where()), or ``(None, set())`` if all rows
+        are read."""
+        if self.data.where is None:
+            return None, set()
+        header = self.header
+        if header.names is not None and len(header.names) == header.n_data_cols:
+            name_indexes = dict((x, i) for i, x in enumerate(header.names))
+        else:
+            # The splitter only returns the values of the header columns
+            name_indexes = dict((x.name, x.index) for x in self._split_cols or header.cols)
+        return _compile_where(self.data.where, name_indexes, self.data.encoding)
+
+    def _set_cols_encoding(self):
+        """Set the encoding of the bytes values of the header columns."""
+        for col in self.header.cols:
+            col.encoding = self.data.encoding
+
+    def _iter_str_vals(self):
+        """Generator to yield the list of column values (as strings) for each
+        data line, where rows that do not match the header have been passed
+        through inconsistent_handler() and rows not selected by ``data.where``
+        have been skipped."""
+        cols = self.header.cols
         n_data_cols = self.header.n_data_cols # number of data cols expected from splitter
-        self.data.splitter.cols = cols
+        where = self._get_where()[0]
 
         for i, str_vals in enumerate(self.data.get_str_vals()):
             if len(str_vals) != n_data_cols:
@@ -873,14 +2258,9 @@ class BaseReader(object):
                                                    [x.name for x in cols], str_vals))
                     raise InconsistentTableError(errmsg)
 
-            for col in cols:
-                col.str_vals.append(str_vals[col.index])
-
-        self.data.masks(cols)
-        self.table = self.outputter(cols)
-        self.cols = self.header.cols
-
-        return self.table
+            if where is not None and not where(str_vals):
+                continue
+            yield str_vals
 
     def inconsistent_handler(self, str_vals, ncols):
         """Adjust or skip data entries if a row is inconsistent with the header.
@@ -908,8 +2288,19 @@ class BaseReader(object):
         if not hasattr(self, 'lines'):
             raise ValueError('Table must be read prior to accessing the header_comment_lines')
         if self.header.comment:
+            lines = self._decoded(self.lines)
             re_comment = re.compile(self.header.comment)
-            comment_lines = [x for x in self.lines if re_comment.match(x)]
+            line_classes = self.data.get_line_classes(self.lines, self.header.comment)
+            if line_classes is not None:
+                # This is the last use of the classes
+                self.data._line_classes = BaseData._line_classes
+                comment_lines = [x for x, line_class in zip(lines, line_classes)
+                                 if line_class == _COMMENT_LINE or
+                                 (line_class == _BLANK_LINE and re_comment.match(x))]
+            else:
+                char = _comment_char(self.header.comment)
+                comment_lines = [x for x in lines
+                                 if (char is None or char in x) and re_comment.match(x)]
         else:
             comment_lines = []
         return comment_lines
@@ -923,6 +2314,10 @@ class BaseReader(object):
         if table is None:
             table = self
 
+        # The columns of a LazyTable output have no data until they are converted
+        if isinstance(getattr(table, 'table', None), LazyTable):
+            table.table.convert_all()
+
         # link information about the columns to the writer object (i.e. self)
         self.header.cols = table.cols
         self.data.cols = self.header.cols
@@ -949,12 +2344,12 @@ class ContinuationLinesInputter(BaseInputter):
     continuation_char = '\\'
 
     def process_lines(self, lines):
-        striplines = (x.strip() for x in lines)
-        lines = [x for x in striplines if len(x) > 0]
-
         parts = []
         outlines = []
         for line in lines:
+            line = line.strip()
+            if not line:
+                continue
             if line.endswith(self.continuation_char):
                 parts.append(line.rstrip(self.continuation_char))
             else:
@@ -965,26 +2360,229 @@ class ContinuationLinesInputter(BaseInputter):
         return outlines
 
 
+class MmapInputter(BaseInputter):
+    """Inputter that memory-maps a table file instead of reading it.  The lines
+    are returned as a :class:`MmapLines` sequence which only locates the line
+    boundaries up front and extracts each line from the file when it is
+    accessed.  Large files are thereby paged in by the operating system as
+    needed rather than being copied into memory as one string plus a list of
+    lines.  Example::
+
+      dat = asciitable.read('big_table.dat', Inputter=asciitable.MmapInputter)
+
+    Lines may end with "\\n" or "\\r\\n".  Input that is not the name of an
+    uncompressed file is handled as for :class:`BaseInputter`.
+
+    :param encoding: encoding used to decode the file lines (default = "utf-8")
+    """
+    encoding = 'utf-8'
+
+    def get_lines(self, table):
+        """Get the lines from the ``table`` input.
+
+        :param table: table input
+        :returns: sequence of lines
+        """
+        if not _is_mappable(table):
+            return BaseInputter.get_lines(self, table)
+        if self.binary:
+            return self.process_lines(MmapLines(table, None))
+        return self.process_lines(MmapLines(table, self.encoding))
+
+    def iter_lines(self, table):
+        """Return an iterator over the lines of the ``table`` input.
+
+        :param table: table input
+        :returns: iterator over lines
+        """
+        if not _is_mappable(table):
+            return BaseInputter.iter_lines(self, table)
+        return iter(self.get_lines(table))
+
+
+def _check_rows(rows):
+    """Raise ValueError unless ``rows`` is a slice of data rows that can be
+    read without knowing the number of rows, i.e. with no negative values."""
+    if any(x is not None and x < 0 for x in (rows.start, rows.stop, rows.step)):
+        raise ValueError('rows must be a slice with non-negative start, stop and step')
+
+def _check_row_counts(nrows, skiprows):
+    """Raise ValueError if the ``nrows`` or ``skiprows`` reader argument is negative."""
+    for name, val in (('nrows', nrows), ('skiprows', skiprows)):
+        if val is not None and val < 0:
+            raise ValueError('%s must not be negative (got %r)' % (name, val))
+
+def _is_file_name(table):
+    """Return True if the table input ``table`` is a file name."""
+    try:
+        return not hasattr(table, 'read') and '\n' not in table and '\r' not in table + ''
+    except TypeError:
+        return False
+
+def _is_mappable(table):
+    """Return True if the table input ``table`` is the name of an uncompressed file."""
+    if not _is_file_name(table):
+        return False
+    fileobj = open(table, 'rb')
+    try:
+        return _get_compression(fileobj.read(6)) is None
+    finally:
+        fileobj.close()
+
+def _find_newlines(buf):
+    """Return an array with the offsets of the newline characters in ``buf``."""
+    size = len(buf)
+    if has_numpy:
+        block_size = 1 << 24
+        offsets = [numpy.flatnonzero(numpy.frombuffer(buf, dtype=numpy.uint8, offset=i,
+                                                      count=min(block_size, size - i)) == 10) + i
+                   for i in range(0, size, block_size)]
+        if offsets:
+            return numpy.concatenate(offsets)
+        return numpy.array([], dtype=numpy.intp)
+
+    offsets = array.array('l')
+    i = buf.find(b'\n')
+    while i >= 0:
+        offsets.append(i)
+        i = buf.find(b'\n', i + 1)
+    return offsets
+
+class MmapLines(object):
+    """Read-only sequence of the lines in the memory-mapped file ``filename``.
+
+    Only the offsets of the line boundaries are stored.  Each line is sliced
+    out of the file and decoded when it is accessed, and slicing a MmapLines
+    object gives another MmapLines object over the same file, as does
+    selecting lines with compress().
+
+    :param filename: name of file
+    :param encoding: encoding used to decode each line (None for bytes lines, ignored for Python 2)
+    """
+    def __init__(self, filename, encoding='utf-8'):
+        fileobj = open(filename, 'rb')
+        try:
+            size = os.fstat(fileobj.fileno()).st_size
+            if size > 0:
+                self._buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = b''
+        finally:
+            fileobj.close()
+
+        self._size = size
+        self._newlines = _find_newlines(self._buffer)
+        self._index = None      # File line numbers of a compress() selection
+        self._start = 0
+        self._stop = len(self._newlines)
+        if size > 0 and self._buffer[size - 1:size] != b'\n':
+            self._stop += 1     # Last line has no newline
+        self.encoding = encoding
+
+    def _view(self, start, stop):
+        view = copy.copy(self)
+        view._start = start
+        view._stop = max(stop, start)
+        return view
+
+    def _line_number(self, i):
+        """Return the file line number of line ``i`` of the underlying
+        sequence (before slicing)."""
+        if self._index is None:
+            return i
+        return self._index[i]
+
+    def compress(self, selectors):
+        """Return a MmapLines object over the lines for which the corresponding
+        item of ``selectors`` is true, as for itertools.compress().  Only the
+        line numbers of the selected lines are stored.
+
+        :param selectors: sequence (e.g. bytearray) of flags for each line
+        :returns: MmapLines
+        """
+        if has_numpy and isinstance(selectors, bytearray):
+            flags = numpy.frombuffer(selectors, dtype=numpy.uint8)[:len(self)]
+            index = numpy.flatnonzero(flags)
+            if self._index is None:
+                index += self._start
+            else:
+                index = numpy.asarray(self._index[self._start:self._stop])[index]
+        else:
+            line_numbers = (self._line_number(i) for i in range(self._start, self._stop))
+            index = array.array('l', itertools.compress(line_numbers, selectors))
+        view = self._view(0, len(index))
+        view._index = index
+        return view
+
+    def _get_line(self, i):
+        """Return line ``i`` (counting from the start of the file)."""
+        start = i and self._newlines[i - 1] + 1
+        if i < len(self._newlines):
+            end = self._newlines[i]
+        else:
+            end = self._size
+        return self._decode_line(self._buffer[start:end])
+
+    def _decode_line(self, line):
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        if self.encoding is not None and str is not bytes:
+            line = line.decode(self.encoding)
+        return line
+
+    def _iter_lines(self, line_numbers):
+        """Yield the lines with the increasing file line numbers ``line_numbers``
+        (a list of ints), taking their offsets from the newline offsets in one go."""
+        first = line_numbers[0]
+        last = line_numbers[-1]
+        # ends[k] is the offset of the newline that ends line first - 1 + k
+        ends = self._newlines[max(first - 1, 0):last + 1].tolist()
+        if first == 0:
+            ends.insert(0, -1)
+        if last >= len(self._newlines):
+            ends.append(self._size)
+        buffer = self._buffer
+        decode_line = self._decode_line
+        for i in line_numbers:
+            k = i - first
+            yield decode_line(buffer[ends[k] + 1:ends[k + 1]])
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return self._view(self._start + start, self._start + stop)
+            return [self[i] for i in range(start, stop, step)]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('line index out of range')
+        return self._get_line(self._line_number(self._start + item))
+
+    def __iter__(self):
+        for start in range(self._start, self._stop, 65536):
+            stop = min(start + 65536, self._stop)
+            if self._index is None:
+                line_numbers = list(range(start, stop))
+            else:
+                line_numbers = self._index[start:stop].tolist()
+            for line in self._iter_lines(line_numbers):
+                yield line
+
+
 class WhitespaceSplitter(DefaultSplitter):
     def process_line(self, line):
         """Replace tab with space within ``line`` while respecting quoted substrings"""
-        newline = []
-        in_quote = False
-        lastchar = None
-        for char in line:
-            if char == self.quotechar and (self.escapechar is None or
-                                           lastchar != self.escapechar):
-                in_quote = not in_quote
-            if char == '\t' and not in_quote:
-                char = ' '
-            lastchar = char
-            newline.append(char)
-
-        return ''.join(newline)
+        return _replace_tab_with_space(line, self.escapechar, self.quotechar)
 
 extra_reader_pars = ('Reader', 'Inputter', 'Outputter',
                      'delimiter', 'comment', 'quotechar', 'header_start',
-                     'data_start', 'data_end', 'converters',
+                     'data_start', 'data_end', 'nrows', 'skiprows', 'numeric', 'where',
+                     'encoding', 'converters', 'infer_rows',
                      'data_Splitter', 'header_Splitter',
                      'names', 'include_names', 'exclude_names',
                      'fill_values', 'fill_include_names', 'fill_exclude_names')
@@ -1020,10 +2618,22 @@ def _get_reader(Reader, Inputter=None, Outputter=None, numpy=True, **kwargs):
         reader.data.start_line = kwargs['data_start']
     if 'data_end' in kwargs:
         reader.data.end_line = kwargs['data_end']
+    if 'encoding' in kwargs:
+        reader.inputter.encoding = kwargs['encoding']
+    if 'nrows' in kwargs:
+        reader.data.nrows = kwargs['nrows']
+    if 'skiprows' in kwargs:
+        reader.data.skiprows = kwargs['skiprows']
+    if 'numeric' in kwargs:
+        reader.data.numeric = kwargs['numeric']
+    if 'where' in kwargs:
+        reader.data.where = kwargs['where']
     if 'header_start' in kwargs:
         reader.header.start_line = kwargs['header_start']
     if 'converters' in kwargs:
         reader.outputter.converters = kwargs['converters']
+    if 'infer_rows' in kwargs:
+        reader.outputter.infer_rows = kwargs['infer_rows']
     if 'data_Splitter' in kwargs:
         reader.data.splitter = kwargs['data_Splitter']()
     if 'header_Splitter' in kwargs:
@@ -34,6 +34,14 @@ import re
 import itertools
 import asciitable.core as core
 from asciitable.core import io, next, izip, any
+if core.has_numpy:
+    import numpy
+
+try:
+    _is_ascii = bytes.isascii
+except AttributeError:
+    def _is_ascii(line):
+        return not line or max(bytearray(line)) < 128
 
 class FixedWidthSplitter(core.BaseSplitter):
     """Split line based on fixed start and end positions for each ``col`` in
@@ -52,13 +60,75 @@ class FixedWidthSplitter(core.BaseSplitter):
     delimiter_pad = ''
     bookend = False
 
+    def supports_bytes(self):
+        """Return True if the splitter can split lines that are bytes.  This is
+        the case unless the splitting has been customized."""
+        return not any(core._overrides(self, x, FixedWidthSplitter)
+                       for x in ('process_val', '__call__'))
+
     def __call__(self, lines):
-        for line in lines:
-            vals = [line[x.start:x.end] for x in self.cols]
-            if self.process_val:
-                yield [self.process_val(x) for x in vals]
+        # The column slices and the value processing are set up once here
+        # instead of being looked up for every line and value.
+        encoding = self.encoding
+        slices = [slice(x.start, x.end) for x in self.cols]
+        process_val = self.process_val
+        if process_val and not core._overrides(self, 'process_val', core.BaseSplitter):
+            split_line = lambda line: [line[x].strip() for x in slices]
+        elif process_val:
+            split_line = lambda line: [process_val(line[x]) for x in slices]
+        else:
+            split_line = lambda line: [line[x] for x in slices]
+
+        if encoding is None:
+            for line in lines:
+                yield split_line(line)
+        else:
+            for line in lines:
+                if _is_ascii(line):
+                    yield split_line(line)
+                else:
+                    # Column positions count characters, not bytes
+                    vals = split_line(line.decode(encoding))
+                    yield [x.encode(encoding) for x in vals]
+
+    def split_columns(self, lines):
+        """Split all of the ``lines`` at once and return a list with a numpy
+        bytes array of the values of each column.  The lines are loaded into
+        a 2-d array of bytes (padded to the longest line) from which each
+        column is taken with one slice.  Returns None if the splitting is
+        customized or a line is not ASCII, since then the lines are split one
+        at a time by __call__().
+
+        :param lines: sequence of lines to split (e.g. a slice view, which is not copied)
+        :returns: list of numpy arrays or None
+        """
+        process_val = self.process_val
+        if (not core.has_numpy or core._overrides(self, '__call__', FixedWidthSplitter) or
+            (process_val is not None and core._overrides(self, 'process_val', core.BaseSplitter))):
+            return None
+
+        width = max(len(x) for x in lines)
+        try:
+            buf = numpy.fromiter(lines, dtype='S%d' % max(width, 1), count=len(lines))
+        except UnicodeEncodeError:
+            return None
+        chars = buf.view(numpy.uint8).reshape(len(lines), -1)
+        if (chars >= 128).any():
+            return None
+
+        str_cols = []
+        for col in self.cols:
+            start = min(col.start, width)
+            end = width if col.end is None else max(start, min(col.end, width))
+            if end > start:
+                vals = numpy.ascontiguousarray(chars[:, start:end]).view('S%d' % (end - start))
+                vals = vals.reshape(len(lines))
             else:
-                yield vals
+                vals = numpy.zeros(len(lines), dtype='S1')
+            if process_val is not None:
+                vals = numpy.char.strip(vals)
+            str_cols.append(vals)
+        return str_cols
 
     def join(self, vals, widths):
         pad = self.delimiter_pad or ''
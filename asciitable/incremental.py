@@ -0,0 +1,148 @@
+"""Asciitable: an extensible ASCII table reader and writer.
+
+incremental.py:
+  Read the rows appended to a growing table file
+
+:Copyright: Smithsonian Astrophysical Observatory (2011)
+:Author: Tom Aldcroft (aldcroft@head.cfa.harvard.edu)
+"""
+
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##     * Redistributions of source code must retain the above copyright
+##       notice, this list of conditions and the following disclaimer.
+##     * Redistributions in binary form must reproduce the above copyright
+##       notice, this list of conditions and the following disclaimer in the
+##       documentation and/or other materials provided with the distribution.
+##     * Neither the name of the Smithsonian Astrophysical Observatory nor the
+##       names of its contributors may be used to endorse or promote products
+##       derived from this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+## ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+## WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+## DISCLAIMED. IN NO EVENT SHALL <COPYRIGHT HOLDER> BE LIABLE FOR ANY
+## DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+## (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+## LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+## ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+## SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import copy
+import locale
+from asciitable.index import _OffsetLine
+
+class IncrementalReader(object):
+    """Read a table file that is growing by rows being appended to it.
+
+    Each call of poll() reads the complete lines appended to the file since
+    the previous call and returns the new data rows.  The header is parsed
+    from the file once and the header lines are kept so that the new lines
+    can be parsed on their own.  The column types found for the first rows
+    are used for all later rows, so set the column types with
+    ``outputter.converters`` if they may change (e.g. from int to float).
+    If the new rows cannot be parsed then poll() raises the error and the
+    same rows are read again by the next poll(), e.g. after setting
+    ``col_types`` to None to find the column types again.
+
+    A last line without a line terminator is not read until it is complete.
+    If the file becomes shorter than the part already read (e.g. it was
+    replaced) then reading starts again from the beginning of the file.
+
+    Example::
+
+      reader = asciitable.IncrementalReader('night.dat', asciitable.get_reader(Reader=asciitable.Basic))
+      while True:
+          dat = reader.poll()
+          if dat is not None:
+              process(dat)
+          time.sleep(60)
+
+    :param table: name of table file
+    :param reader: reader object for the table format, which is copied for each poll()
+    """
+    def __init__(self, table, reader):
+        self.table = table
+        self.reader = copy.deepcopy(reader)
+        # The lines are decoded here and given to the reader as text
+        self.encoding = self.reader.inputter.encoding or locale.getpreferredencoding(False)
+        self.reader.inputter.encoding = None
+        # Any table footer is not known until the table is complete
+        self.reader.data.end_line = None
+        self.reset()
+
+    def reset(self):
+        """Start reading again from the beginning of the file."""
+        self.offset = 0
+        self.header_lines = None
+        self.col_types = None
+
+    def poll(self):
+        """Read the complete lines appended to the table file since the last
+        call and return the new data rows in a format determined by the
+        ``outputter`` attribute of the reader.
+
+        :returns: output table, or None if there are no new data rows
+        """
+        if os.path.getsize(self.table) < self.offset:
+            self.reset()
+        lines, offset = self._read_new_lines()
+
+        header_lines = self.header_lines
+        if header_lines is None:
+            reader = self._get_reader()
+            reader.data.get_data_lines(lines)
+            data_lines = reader.data.data_lines
+            if not data_lines:
+                # Read the header lines again once there are data lines
+                return None
+            data_start = data_lines[0].offset
+            header_lines = [str(x) for x in lines if x.offset < data_start]
+            lines = [x for x in lines if x.offset >= data_start]
+
+        reader = self._get_reader()
+        reader._stream_lines(header_lines + lines)
+        if self.col_types is not None:
+            for col, col_type in zip(reader.header.cols, self.col_types):
+                col.type = col_type
+        dat = reader._read_data()
+
+        # The new lines are only marked as read once they are parsed, so the
+        # same rows are read again by the next poll() if this one fails.
+        self.offset = offset
+        self.header_lines = header_lines
+        if not reader.cols or len(dat) == 0:
+            return None
+        self.col_types = [col.type for col in reader.cols]
+        return dat
+
+    def _get_reader(self):
+        reader = copy.deepcopy(self.reader)
+        reader._prepare_read(self.table)
+        return reader
+
+    def _read_new_lines(self):
+        """Return the complete lines after ``offset`` as _OffsetLine objects
+        and the file offset of the end of them."""
+        fileobj = open(self.table, 'rb')
+        try:
+            fileobj.seek(self.offset)
+            data = fileobj.read()
+        finally:
+            fileobj.close()
+        data = data[:data.rfind(b'\n') + 1]
+
+        lines = []
+        offset = self.offset
+        for raw_line in data.splitlines(True):
+            end = offset + len(raw_line)
+            line = raw_line.rstrip(b'\r\n')
+            if str is not bytes:
+                line = line.decode(self.encoding)
+            lines.append(_OffsetLine(line, offset, end))
+            offset = end
+        return lines, offset
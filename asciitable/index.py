@@ -0,0 +1,208 @@
+"""Asciitable: an extensible ASCII table reader and writer.
+
+index.py:
+  Byte offset index of the data lines in a table file for random row access
+
+:Copyright: Smithsonian Astrophysical Observatory (2011)
+:Author: Tom Aldcroft (aldcroft@head.cfa.harvard.edu)
+"""
+
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##     * Redistributions of source code must retain the above copyright
+##       notice, this list of conditions and the following disclaimer.
+##     * Redistributions in binary form must reproduce the above copyright
+##       notice, this list of conditions and the following disclaimer in the
+##       documentation and/or other materials provided with the distribution.
+##     * Neither the name of the Smithsonian Astrophysical Observatory nor the
+##       names of its contributors may be used to endorse or promote products
+##       derived from this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+## ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+## WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+## DISCLAIMED. IN NO EVENT SHALL <COPYRIGHT HOLDER> BE LIABLE FOR ANY
+## DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+## (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+## LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+## ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+## SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import json
+import locale
+import asciitable.core as core
+
+INDEX_VERSION = 1
+
+class _OffsetLine(str):
+    """Table line that knows the byte offsets in the file where it starts
+    and where the next line starts."""
+    def __new__(cls, line, offset, end):
+        self = str.__new__(cls, line)
+        self.offset = offset
+        self.end = end
+        return self
+
+def get_index_file(table):
+    """Return the name of the index file for the table file ``table``."""
+    return table + '.idx'
+
+def _iter_lines(table, encoding):
+    """Iterate over the lines of the file ``table`` as _OffsetLine objects."""
+    offset = 0
+    fileobj = open(table, 'rb')
+    try:
+        for raw_line in fileobj:
+            end = offset + len(raw_line)
+            line = raw_line.rstrip(b'\r\n')
+            if str is not bytes:
+                line = line.decode(encoding)
+            yield _OffsetLine(line, offset, end)
+            offset = end
+    finally:
+        fileobj.close()
+
+def _read_lines(table, encoding):
+    """Read the lines of the file ``table`` as _OffsetLine objects."""
+    return list(_iter_lines(table, encoding))
+
+def _get_encoding(reader):
+    """Return the encoding of the table file read by ``reader``."""
+    return reader.inputter.encoding or locale.getpreferredencoding(False)
+
+def write_index(table, reader, every=1000):
+    """Write the index file for the table file ``table`` as read with ``reader``.
+
+    The index is a JSON file next to the table (see get_index_file()) that
+    holds the size and modification time of the table file, the table lines
+    before the first data line and the byte offset of every ``every``-th data
+    line.
+
+    :param table: name of table file
+    :param reader: reader object for the table format
+    :param every: number of data lines between indexed offsets
+    :returns: name of index file
+    """
+    if every < 1:
+        raise ValueError('every must be a positive integer')
+    if not core._is_mappable(table):
+        raise ValueError('Only an uncompressed table file can be indexed')
+
+    stat = os.stat(table)
+    encoding = _get_encoding(reader)
+    lines = _read_lines(table, encoding)
+
+    reader._prepare_read(table)
+    reader.data.get_data_lines(reader.inputter.process_lines(lines))
+    data_lines = reader.data.data_lines
+    if not all(isinstance(x, _OffsetLine) for x in data_lines):
+        raise ValueError('Table data lines are modified by the reader so they cannot be indexed')
+
+    if data_lines:
+        data_start = data_lines[0].offset
+        data_end = data_lines[-1].end
+    else:
+        data_start = data_end = stat.st_size
+    index = {'version': INDEX_VERSION,
+             'size': stat.st_size,
+             'mtime': stat.st_mtime,
+             'encoding': encoding,
+             'every': every,
+             'n_rows': len(data_lines),
+             'header_lines': [str(x) for x in lines if x.offset < data_start],
+             'offsets': [x.offset for x in data_lines[::every]],
+             'data_end': data_end,
+             }
+
+    index_file = get_index_file(table)
+    fileobj = open(index_file, 'w')
+    try:
+        json.dump(index, fileobj)
+    finally:
+        fileobj.close()
+
+    return index_file
+
+def load_index(table):
+    """Return the index for the table file ``table``, or None if ``table`` is
+    not a file name or the index file does not exist or is out of date.
+
+    :param table: table input
+    :returns: index dict or None
+    """
+    if not core._is_file_name(table):
+        return None
+    try:
+        fileobj = open(get_index_file(table), 'r')
+        try:
+            index = json.load(fileobj)
+        finally:
+            fileobj.close()
+        stat = os.stat(table)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if (index.get('version') != INDEX_VERSION or index['size'] != stat.st_size
+        or index['mtime'] != stat.st_mtime):
+        return None
+    return index
+
+def read_rows(table, reader, rows):
+    """Read the data rows selected by the slice ``rows`` from ``table`` with
+    ``reader``.  If ``table`` has an up to date index file then only the table
+    header lines and the indexed blocks of data lines containing ``rows`` are
+    read from the file.  Otherwise the whole table is streamed with
+    BaseReader.read_rows().
+
+    :param table: table input
+    :param reader: reader object for the table format
+    :param rows: slice selecting the data rows (first data row has index 0, no negative values)
+    :returns: output table
+    """
+    core._check_rows(rows)
+    index = load_index(table)
+    if index is None or index['encoding'] != _get_encoding(reader):
+        return reader.read_rows(table, rows)
+
+    start, stop, step = rows.indices(index['n_rows'])
+    stop = max(start, stop)
+    every = index['every']
+    offsets = index['offsets']
+    block_start = start // every
+    block_stop = -(-stop // every)
+
+    fileobj = open(table, 'rb')
+    try:
+        if start == stop:
+            # No rows are selected, but as for the unindexed read the first
+            # data line is still read since it may name the columns (NoHeader)
+            start = stop = block_start = 0
+            data = b''
+            if offsets:
+                fileobj.seek(offsets[0])
+                data = fileobj.readline()
+        elif block_start < len(offsets):
+            fileobj.seek(offsets[block_start])
+            if block_stop < len(offsets):
+                data = fileobj.read(offsets[block_stop] - offsets[block_start])
+            else:
+                data = fileobj.read(index['data_end'] - offsets[block_start])
+        else:
+            data = b''
+    finally:
+        fileobj.close()
+    if str is not bytes:
+        data = data.decode(index['encoding'])
+
+    # The lines read end at the last data line so any table footer (or end
+    # marker) is absent.
+    reader.data.table_name = os.path.basename(table)
+    reader.data.end_line = None
+    # The lines are decoded here and given to the reader as text
+    reader.inputter.encoding = None
+    lines = index['header_lines'] + data.splitlines()
+    first = block_start * every
+    return reader.read_rows(lines, slice(start - first, stop - first, step))
@@ -141,7 +141,8 @@ class IpacHeader(core.BaseHeader):
                         fillval = 'nan'
                     else:
                         fillval = '-999'
-                    self.data.fill_values.append((col.null, fillval, col.name))
+                    # Not append() since fill_values may be the BaseData class list
+                    self.data.fill_values = self.data.fill_values + [(col.null, fillval, col.name)]
             start = col.end + 1
             cols.append(col)
         
@@ -157,6 +158,7 @@ class IpacHeader(core.BaseHeader):
         # FixedWidthSplitter does NOT return the ignored cols (as is the
         # case for typical delimiter-based splitters)
         self.cols = [x for x in cols if x.name in names]
+        self.n_data_cols = len(self.cols)
         for i, col in enumerate(self.cols):
             col.index = i
 
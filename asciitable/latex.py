@@ -65,19 +65,37 @@ def find_latex_line(lines, latex):
     :param latex: search pattern
     :returns: line number or None, if no match was found
     '''
-    re_string = re.compile(latex.replace('\\', '\\\\'))
-    for i,line in enumerate(lines):
-        if re_string.match(line):
-            return i
-    else:
-        return None
+    return find_latex_lines(lines, [latex]).get(latex)
+
+def find_latex_lines(lines, latexs):
+    '''Find the first line which matches each of the patterns in one pass
+    over the lines.  The pass stops once all of the patterns are found.
+
+    :param lines: list of strings
+    :param latexs: list of search patterns
+    :returns: dict of the line number of each pattern that was found
+    '''
+    re_strings = dict((x, re.compile(x.replace('\\', '\\\\'))) for x in latexs)
+    if not re_strings:
+        return {}
+    # One regex match per line finds the (few) lines that match any pattern
+    re_any = re.compile('|'.join('(?:%s)' % x.pattern for x in re_strings.values()))
+    found = {}
+    for i, line in enumerate(lines):
+        if re_any.match(line):
+            for latex, re_string in re_strings.items():
+                if latex not in found and re_string.match(line):
+                    found[latex] = i
+            if len(found) == len(re_strings):
+                break
+    return found
 
 
 class LatexHeader(core.BaseHeader):
     header_start = r'\begin{tabular}'
     
     def start_line(self, lines):
-        line = find_latex_line(lines, self.header_start)
+        line = self.data.find_latex_lines(lines).get(self.header_start)
         if line:
             return line + 1
         else:
@@ -103,16 +121,33 @@ class LatexHeader(core.BaseHeader):
 class LatexData(core.BaseData):
     data_start = None
     data_end = r'\end{tabular}'
+    _latex_lines = (None, {})
     
+    def find_latex_lines(self, lines):
+        '''Find the first line of ``lines`` which matches each of the header
+        and data start and end patterns.  All of the patterns are found in
+        one pass over ``lines`` and the result is kept for further calls with
+        the same ``lines``, so the header and data positions take one scan.
+
+        :param lines: list of strings
+        :returns: dict of the line number of each pattern that was found
+        '''
+        cached_lines, found = self._latex_lines
+        if cached_lines is not lines:
+            latexs = [x for x in (self.header.header_start, self.data_start, self.data_end) if x]
+            found = find_latex_lines(lines, latexs)
+            self._latex_lines = (lines, found)
+        return found
+
     def start_line(self, lines):
         if self.data_start:
-            return find_latex_line(lines, self.data_start)
+            return self.find_latex_lines(lines).get(self.data_start)
         else:
             return self.header.start_line(lines) + 1
     
     def end_line(self, lines):
         if self.data_end:
-            return find_latex_line(lines, self.data_end)
+            return self.find_latex_lines(lines).get(self.data_end)
         else:
             return None
 
@@ -293,7 +328,7 @@ class AASTexHeader(LatexHeader):
     header_start = r'\tablehead'
 
     def start_line(self, lines):
-        return find_latex_line(lines, r'\tablehead')
+        return self.data.find_latex_lines(lines).get(self.header_start)
 
     def write(self, lines):
         if not 'col_align' in self.latex.keys():
@@ -316,7 +351,7 @@ class AASTexData(LatexData):
     data_end = r'\enddata'
 
     def start_line(self, lines):
-        return find_latex_line(lines, self.data_start) + 1
+        return self.find_latex_lines(lines).get(self.data_start) + 1
 
     def write(self, lines):
         lines.append(self.data_start)
@@ -93,20 +93,21 @@ class Memory(core.BaseReader):
         self.data.get_data_lines(self.lines)
         self.header.get_cols(self.lines)
         cols = self.header.cols         # header.cols corresponds to *output* columns requested
-        n_data_cols = len(self.header.names) # header.names corresponds to *all* header columns in table
         self.data.splitter.cols = cols
 
-        for i, str_vals in enumerate(self.data.get_str_vals()):
-            if len(list(str_vals)) != n_data_cols:
-                errmsg = ('Number of header columns (%d) inconsistent with '
-                          'data columns (%d) at data line %d\n'
-                          'Header values: %s\n'
-                          'Data values: %s' % (len(cols), len(str_vals), i,
-                                               [x.name for x in cols], str_vals))
-                raise core.InconsistentTableError(errmsg)
-
+        if self.data.where is not None:
+            name_indexes = dict((x, i) for i, x in enumerate(self.header.names))
+            where = core._compile_where(self.data.where, name_indexes)[0]
+            data_cols = None
+        else:
+            where = None
+            data_cols = _get_data_cols(self.data.data_lines)
+        if data_cols is not None:
+            # Take just the requested columns instead of going row by row
             for col in cols:
-                col.str_vals.append(str_vals[col.index])
+                col.str_vals = list(data_cols[col.index])
+        else:
+            core._extend_str_vals(cols, self._iter_str_vals(where))
 
         self.data.masks(cols)
         self.cols = cols
@@ -121,12 +122,51 @@ class Memory(core.BaseReader):
 
         return self.table
 
+    def _iter_str_vals(self, where=None):
+        """Generator to yield the data values of each row that is selected by the
+        ``where`` function of the values."""
+        cols = self.header.cols
+        n_data_cols = len(self.header.names)
+        for i, str_vals in enumerate(self.data.get_str_vals()):
+            if len(str_vals) != n_data_cols:
+                errmsg = ('Number of header columns (%d) inconsistent with '
+                          'data columns (%d) at data line %d\n'
+                          'Header values: %s\n'
+                          'Data values: %s' % (len(cols), len(str_vals), i,
+                                               [x.name for x in cols], str_vals))
+                raise core.InconsistentTableError(errmsg)
+
+            if where is None or where(str_vals):
+                yield str_vals
+
+    def iter_chunks(self, table, chunk_rows=10000):
+        """Not available for the Memory class (raises NotImplementedError)"""
+        raise NotImplementedError
+
+    def read_rows(self, table, rows):
+        """Not available for the Memory class (raises NotImplementedError)"""
+        raise NotImplementedError
+
     def write(self, table=None):
         """Not available for the Memory class (raises NotImplementedError)"""
         raise NotImplementedError
 
 MemoryReader = Memory
 
+def _get_data_cols(lines):
+    """Return the list of data columns of the table ``lines`` if it holds its
+    values by column (a DictLikeNumpy object or a NumPy structured array that
+    is not masked), or None to read the table row by row."""
+    if isinstance(lines, core.DictLikeNumpy):
+        data_cols = [lines[name] for name in lines.dtype.names]
+        if len(set(len(x) for x in data_cols)) > 1:
+            return None
+        return data_cols
+    if (core.has_numpy and type(lines) in (numpy.ndarray, numpy.recarray) and
+        lines.dtype.names is not None):
+        return [lines[name] for name in lines.dtype.names]
+    return None
+
 class MemoryInputter(core.BaseInputter):
     """Get the lines from the table input and return an iterable object that contains the data lines.
 
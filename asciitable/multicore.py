@@ -0,0 +1,186 @@
+"""Asciitable: an extensible ASCII table reader and writer.
+
+multicore.py:
+  Parse a single large delimited table file with a pool of worker processes
+
+:Copyright: Smithsonian Astrophysical Observatory (2011)
+:Author: Tom Aldcroft (aldcroft@head.cfa.harvard.edu)
+"""
+
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##     * Redistributions of source code must retain the above copyright
+##       notice, this list of conditions and the following disclaimer.
+##     * Redistributions in binary form must reproduce the above copyright
+##       notice, this list of conditions and the following disclaimer in the
+##       documentation and/or other materials provided with the distribution.
+##     * Neither the name of the Smithsonian Astrophysical Observatory nor the
+##       names of its contributors may be used to endorse or promote products
+##       derived from this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+## ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+## WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+## DISCLAIMED. IN NO EVENT SHALL <COPYRIGHT HOLDER> BE LIABLE FOR ANY
+## DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+## (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+## LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+## ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+## SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import locale
+import pickle
+import multiprocessing
+import asciitable.core as core
+import asciitable.basic as basic
+import asciitable.index as index
+
+# Reader classes whose table is a header followed by one data row per line
+# that can be split anywhere between lines.
+PARALLEL_READERS = (basic.Basic, basic.Tab, basic.NoHeader, basic.CommentedHeader)
+
+# Minimum number of bytes of data lines for each worker process.  Smaller
+# tables are read serially since starting the workers costs more than it saves.
+MIN_RANGE_BYTES = 1 << 20
+
+def read_parallel(table, read_kwargs, workers=None):
+    """Read the table file ``table`` with the reader given by ``read_kwargs``
+    (as for ui.get_reader()) by splitting and converting byte ranges of the
+    data lines in a pool of ``workers`` processes.  The header is parsed once
+    in the calling process and the tables from the ranges are concatenated
+    in order.  If the ranges find different types for a column (e.g. int in
+    one and float in another) then the ranges are read again with the widest
+    of the types.
+
+    Returns None if the table cannot be read this way, i.e. it is not an
+    uncompressed file, the reader is not one of PARALLEL_READERS, the reader
+    is customized in a way that needs all of the lines at once (callable
+    ``data_start``, ``data_end``, ``nrows``, ``skiprows`` etc.), the keyword
+    args cannot be pickled, or the table is too small to be worth it.
+
+    :param table: name of table file
+    :param read_kwargs: keyword args for ui.get_reader()
+    :param workers: number of worker processes (default=None for the number of CPUs)
+    :returns: output table or None
+    """
+    if not core._is_mappable(table):
+        return None
+    read_kwargs = dict(read_kwargs)
+    read_kwargs.setdefault('Reader', basic.Basic)
+    try:
+        pickle.dumps(read_kwargs)
+    except Exception:
+        return None
+
+    reader = core._get_reader(**read_kwargs)
+    if not _is_parallel_reader(reader):
+        return None
+
+    names, data_start = _read_header(table, reader)
+    if data_start is None:
+        return None
+
+    n_ranges = min(workers or multiprocessing.cpu_count(),
+                   (os.path.getsize(table) - data_start) // MIN_RANGE_BYTES)
+    if n_ranges < 2:
+        return None
+    ranges = _get_ranges(table, data_start, n_ranges)
+
+    jobs = [(table, start, end, read_kwargs, names, None) for start, end in ranges]
+    pool = multiprocessing.Pool(n_ranges)
+    try:
+        results = pool.map(_read_range, jobs)
+
+        # Read again any ranges whose column types differ from the widest ones
+        col_types = [_widest_type(x) for x in zip(*[types for dat, types in results])]
+        redo = [i for i, (dat, types) in enumerate(results) if types != col_types]
+        if redo:
+            redo_jobs = [jobs[i][:-1] + (col_types,) for i in redo]
+            for i, result in zip(redo, pool.map(_read_range, redo_jobs)):
+                results[i] = result
+    finally:
+        pool.close()
+        pool.join()
+
+    return core._concatenate_tables([dat for dat, types in results])
+
+def _is_parallel_reader(reader):
+    """Return True if the table of ``reader`` can be read in byte ranges."""
+    data = reader.data
+    return (type(reader) in PARALLEL_READERS and
+            data.end_line is None and
+            not hasattr(data.start_line, '__call__') and
+            data.nrows is None and
+            not data.skiprows and
+            not core._overrides(reader.inputter, 'process_lines', core.BaseInputter) and
+            not core._overrides(data, 'process_lines', core.BaseData))
+
+def _read_header(table, reader):
+    """Parse the header of the file ``table`` with ``reader`` and return
+    (column names, byte offset of the first data line).  The offset is None if
+    the table has no data lines."""
+    encoding = reader.inputter.encoding or locale.getpreferredencoding(False)
+    # The header is parsed from str lines that know their byte offsets
+    reader.inputter.encoding = None
+    reader._prepare_read(table)
+    reader._stream_lines(table, lines=index._iter_lines(table, encoding))
+    for line in reader.data.data_lines:
+        return reader.header.names, line.offset
+    return reader.header.names, None
+
+def _get_ranges(table, data_start, n_ranges):
+    """Split the bytes of the file ``table`` from ``data_start`` to the end into
+    ``n_ranges`` (start, end) ranges of about equal size that each start at the
+    beginning of a line."""
+    size = os.path.getsize(table)
+    starts = [data_start]
+    fileobj = open(table, 'rb')
+    try:
+        for i in range(1, n_ranges):
+            # Move to the start of the first line that begins at or after the cut
+            fileobj.seek(data_start + (size - data_start) * i // n_ranges - 1)
+            fileobj.readline()
+            starts.append(max(fileobj.tell(), starts[-1]))
+    finally:
+        fileobj.close()
+    return [(start, end) for start, end in zip(starts, starts[1:] + [size]) if end > start]
+
+def _read_range(job):
+    """Read the data lines in a byte range of a table file in a worker process
+    for read_parallel() and return (output table, column types)."""
+    table, start, end, read_kwargs, names, col_types = job
+    reader = core._get_reader(**read_kwargs)
+    reader.header.names = names
+    reader.header.start_line = None
+    reader.data.start_line = 0
+    reader._prepare_read(table)
+
+    fileobj = open(table, 'rb')
+    try:
+        fileobj.seek(start)
+        lines = fileobj.read(end - start).splitlines()
+    finally:
+        fileobj.close()
+    if not reader.inputter.binary and str is not bytes:
+        encoding = reader.inputter.encoding or locale.getpreferredencoding(False)
+        lines = [x.decode(encoding) for x in lines]
+
+    reader._stream_lines(lines)
+    if col_types is not None:
+        for col, col_type in zip(reader.header.cols, col_types):
+            col.type = col_type
+    dat = reader._read_data()
+    return dat, [col.type for col in reader.cols]
+
+def _widest_type(col_types):
+    """Return the column type that can hold all the values of columns with
+    types ``col_types``."""
+    if all(x is col_types[0] for x in col_types):
+        return col_types[0]
+    if all(issubclass(x, core.NumType) for x in col_types):
+        return core.FloatType
+    return core.StrType
@@ -35,6 +35,9 @@ ui.py:
 import re
 import os
 import sys
+import pickle
+import itertools
+import multiprocessing
 
 import asciitable.core as core
 import asciitable.basic as basic
@@ -42,6 +45,8 @@ import asciitable.cds as cds
 import asciitable.daophot as daophot
 import asciitable.ipac as ipac
 import asciitable.memory as memory
+import asciitable.index as index
+import asciitable.multicore as multicore
 from asciitable.core import next, izip, any
 import asciitable.latex as latex
 
@@ -69,7 +74,13 @@ def get_reader(Reader=None, Inputter=None, Outputter=None, numpy=True, **kwargs)
     :param header_start: line index for the header line not counting comment lines
     :param data_start: line index for the start of data not counting comment lines
     :param data_end: line index for the end of data (can be negative to count from end)
+    :param nrows: maximum number of data rows to read, not negative (default=None reads all rows)
+    :param skiprows: number of data rows to skip before reading, not negative (default=0)
+    :param numeric: True if all data values are numbers, False to disable the all-numeric check (default=None checks)
+    :param where: function of a dict of row values or (name, op, value) tuples selecting the data rows to read (default=None reads all rows)
+    :param encoding: encoding of the table file (default=None for the platform default)
     :param converters: dict of converters
+    :param infer_rows: number of rows used to infer each column type before converting the column at once (default=None)
     :param data_Splitter: Splitter class to split data columns
     :param header_Splitter: Splitter class to split header columns
     :param names: list of names corresponding to each data column
@@ -86,15 +97,31 @@ def get_reader(Reader=None, Inputter=None, Outputter=None, numpy=True, **kwargs)
     reader = core._get_reader(Reader, Inputter=Inputter, Outputter=Outputter, numpy=numpy, **kwargs)
     return reader
 
-def read(table, numpy=True, guess=None, **kwargs):
+def read(table, numpy=True, guess=None, rows=None, parallel=None, **kwargs):
     """Read the input ``table``.  If ``numpy`` is True (default) return the
     table in a numpy record array.  Otherwise return the table as a dictionary
     of column objects using plain python lists to hold the data.  Most of the
     default behavior for various parameters is determined by the Reader class.
 
+    If ``rows`` is given then only the data rows selected by that slice are
+    read, where the slice start, stop and step must not be negative.  When
+    guessing, the format is guessed from the first lines of the table.  For
+    a table file with an up to date index (see :func:`build_index`) only the
+    lines holding the selected rows are read from the file.
+
+    If ``parallel`` is given then a large table file in one of the simple
+    delimited formats (:class:`Basic`, :class:`Tab`, :class:`NoHeader` or
+    :class:`CommentedHeader`) is split into ranges of data lines that are
+    parsed by ``parallel`` worker processes.  When guessing, the format is
+    guessed from the first lines of the file, and if that format fails on the
+    rest of the file then the whole file is guessed and read serially.  Any
+    other table is read serially.
+
     :param table: input table (file name, list of strings, or single newline-separated string)
     :param numpy: use the :class:`NumpyOutputter` class else use :class:`BaseOutputter` (default=True)
     :param guess: try to guess the table format (default=True)
+    :param rows: slice selecting the data rows to read (default=None reads all rows)
+    :param parallel: number of worker processes to parse a large table file (default=None reads serially)
     :param Reader: Reader class (default= :class:`~asciitable.BasicReader`)
     :param Inputter: Inputter class
     :param Outputter: Outputter class
@@ -104,7 +131,13 @@ def read(table, numpy=True, guess=None, **kwargs):
     :param header_start: line index for the header line not counting comment lines
     :param data_start: line index for the start of data not counting comment lines
     :param data_end: line index for the end of data (can be negative to count from end)
+    :param nrows: maximum number of data rows to read, not negative (default=None reads all rows)
+    :param skiprows: number of data rows to skip before reading, not negative (default=0)
+    :param numeric: True if all data values are numbers, False to disable the all-numeric check (default=None checks)
+    :param where: function of a dict of row values or (name, op, value) tuples selecting the data rows to read (default=None reads all rows)
+    :param encoding: encoding of the table file (default=None for the platform default)
     :param converters: dict of converters
+    :param infer_rows: number of rows used to infer each column type before converting the column at once (default=None)
     :param data_Splitter: Splitter class to split data columns
     :param header_Splitter: Splitter class to split header columns
     :param names: list of names corresponding to each data column
@@ -116,6 +149,199 @@ def read(table, numpy=True, guess=None, **kwargs):
 
     """
 
+    new_kwargs = _get_outputter_kwargs(numpy, kwargs)
+    core._check_row_counts(kwargs.get('nrows'), kwargs.get('skiprows'))
+
+    if guess is None:
+        guess = _GUESS
+    if rows is not None:
+        core._check_rows(rows)
+        if guess:
+            if _get_rewind(table) is None:
+                table = list(core.BaseInputter().iter_lines(table))
+            new_kwargs = _guess_head(table, new_kwargs)
+        return index.read_rows(table, get_reader(**new_kwargs), rows)
+
+    if parallel is not None and parallel > 1 and core._is_mappable(table):
+        if guess:
+            # The format guessed from the head lines may not fit the rest of
+            # the file, in which case guess again serially from all of it.
+            try:
+                dat = multicore.read_parallel(table, _guess_head(table, new_kwargs), parallel)
+            except (core.InconsistentTableError, ValueError, TypeError):
+                dat = None
+        else:
+            dat = multicore.read_parallel(table, new_kwargs, parallel)
+        if dat is not None:
+            return dat
+
+    if guess:
+        dat = _guess(table, new_kwargs)[0]
+    else:
+        reader = get_reader(**new_kwargs)
+        dat = reader.read(table)
+    return dat
+
+def _guess_head(table, read_kwargs):
+    """Return the keyword args to read ``table`` as guessed from its first
+    lines, or from the whole table if those are not enough (e.g. for a table
+    with an end marker).  A file-like ``table`` is left at its position.
+
+    :returns: keyword args for get_reader()
+    """
+    rewind = _get_rewind(table)
+    try:
+        try:
+            head_lines = _get_head_lines(table, read_kwargs.get('encoding'))
+        finally:
+            rewind()
+        return _guess(head_lines, read_kwargs)[1]
+    except (core.InconsistentTableError, ValueError):
+        # Includes a UnicodeDecodeError from the head lines
+        guess_kwargs = _guess(table, read_kwargs)[1]
+        rewind()
+        return guess_kwargs
+
+def _get_head_lines(table, encoding=None, n_lines=1000):
+    """Return the first ``n_lines`` lines of the table file ``table``."""
+    inputter = core.BaseInputter()
+    inputter.encoding = encoding
+    return list(itertools.islice(inputter.iter_lines(table), n_lines))
+
+def read_chunks(table, chunk_rows=10000, numpy=True, **kwargs):
+    """Read the input ``table`` incrementally and return a generator that yields
+    the table in chunks of at most ``chunk_rows`` rows.  Each chunk is a numpy
+    record array if ``numpy`` is True (default) and otherwise a dictionary of
+    column objects, as for :func:`read`.  Only one chunk of the table needs to
+    be in memory at a time, see :meth:`BaseReader.iter_chunks` for details.
+
+    The column types are pinned by the first chunk.  A later chunk with a
+    value that needs a wider type (e.g. a float in an int column) raises
+    InconsistentTableError naming the column and data row, so in that case
+    give the column type with ``converters`` as shown in the error message,
+    e.g. ``converters={'b': [asciitable.convert_numpy(float)]}``.
+
+    The table format is not guessed, so specify ``Reader`` and any other format
+    parameters as needed.  All the parameters of :func:`get_reader` are accepted.
+
+    :param table: input table (file name, file-like object, list of strings, or single newline-separated string)
+    :param chunk_rows: maximum number of rows in each chunk (default=10000)
+    :param numpy: use the :class:`NumpyOutputter` class else use :class:`BaseOutputter` (default=True)
+    :param Reader: Reader class (default= :class:`~asciitable.BasicReader`)
+    :param converters: dict of converters, which override the column types of the first chunk
+    """
+    reader = get_reader(**_get_outputter_kwargs(numpy, kwargs))
+    return reader.iter_chunks(table, chunk_rows)
+
+def read_many(tables, workers=None, concatenate=False, numpy=True, guess=None, **kwargs):
+    """Read each of the input ``tables`` using a pool of ``workers`` processes.
+    The keyword arguments are the same as for :func:`read`.  If guessing is
+    enabled then the table format is guessed only for the first table that can
+    be read and the format found is used for the rest of the tables, so the
+    tables should all have the same format.  Any table that cannot be read in
+    that format is then read with guessing.
+
+    An error in reading one table does not stop the others from being read.
+    Instead the exceptions are returned in the ``errors`` dict keyed by the
+    index of the table in ``tables``.  If ``concatenate`` is True then the
+    tables that were read are joined into one table, which requires that they
+    have the same column names and kinds (numbers or strings).
+
+    The tables are read in the calling process if ``workers`` is 1 or if the
+    tables or keyword arguments cannot be pickled (e.g. file-like objects or
+    converter functions defined in a function).
+
+    :param tables: list of input tables (as for :func:`read`)
+    :param workers: number of worker processes (default=None for the number of CPUs)
+    :param concatenate: join the tables into one table (default=False)
+    :param numpy: use the :class:`NumpyOutputter` class else use :class:`BaseOutputter` (default=True)
+    :param guess: try to guess the table format (default=True)
+    :returns: tuple (list of output tables with None for errors, errors) or if
+              ``concatenate`` is True then (output table, errors)
+    """
+    tables = list(tables)
+    read_kwargs = _get_outputter_kwargs(numpy, kwargs)
+    if guess is None:
+        guess = _GUESS
+
+    outputs = [None] * len(tables)
+    errors = {}
+
+    # Guess the format from the first table that can be read
+    i_start = 0
+    table_kwargs = read_kwargs
+    if guess:
+        for i_start, table in enumerate(tables):
+            try:
+                outputs[i_start], table_kwargs = _guess(table, read_kwargs)
+                break
+            except Exception:
+                errors[i_start] = sys.exc_info()[1]
+        i_start += 1
+
+    jobs = [(table, table_kwargs, guess and read_kwargs) for table in tables[i_start:]]
+    if workers != 1 and len(jobs) > 1 and _is_picklable(jobs):
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = pool.map(_read_job, jobs)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_read_job(job) for job in jobs]
+
+    for i, (dat, error) in enumerate(results, i_start):
+        if error is None:
+            outputs[i] = dat
+        else:
+            errors[i] = error
+
+    if concatenate:
+        return core._concatenate_tables([x for i, x in enumerate(outputs) if i not in errors]), errors
+    return outputs, errors
+
+def _read_job(job):
+    """Read one table for read_many() and return (output table, None) or
+    (None, exception)."""
+    table, table_kwargs, read_kwargs = job
+    try:
+        try:
+            return get_reader(**table_kwargs).read(table), None
+        except (core.InconsistentTableError, ValueError, TypeError):
+            if not read_kwargs:
+                raise
+            return _guess(table, read_kwargs)[0], None
+    except Exception:
+        return None, sys.exc_info()[1]
+
+def _is_picklable(obj):
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+def build_index(table, every=1000, **kwargs):
+    """Build the index file for the table file ``table`` which allows
+    :func:`read` to read a range of ``rows`` from the table without parsing
+    the rest of it.  The index is written as JSON to ``table`` + ".idx" and
+    holds the table header lines plus the byte offset of every ``every``-th
+    data line.  It is ignored once the size or modification time of the
+    table file changes.
+
+    The table format is not guessed, so specify ``Reader`` and any other format
+    parameters as needed.  These should be the same as those used for reading.
+
+    :param table: name of an uncompressed table file
+    :param every: number of data lines between indexed offsets (default=1000)
+    :param Reader: Reader class (default= :class:`~asciitable.BasicReader`)
+    :returns: name of the index file
+    """
+    return index.write_index(table, get_reader(**kwargs), every)
+
+def _get_outputter_kwargs(numpy, kwargs):
+    """Return a copy of the reader ``kwargs`` including the Outputter that
+    corresponds to ``numpy``."""
     # Provide a simple way to choose between the two common outputters.  If an Outputter is
     # supplied in kwargs that will take precedence.
     new_kwargs = {}
@@ -124,15 +350,7 @@ def read(table, numpy=True, guess=None, **kwargs):
     else:
         new_kwargs['Outputter'] = core.BaseOutputter
     new_kwargs.update(kwargs)
-        
-    if guess is None:
-        guess = _GUESS
-    if guess:
-        dat = _guess(table, new_kwargs)
-    else:
-        reader = get_reader(**new_kwargs)
-        dat = reader.read(table)
-    return dat
+    return new_kwargs
 
 def _is_number(x):
     try:
@@ -147,11 +365,20 @@ def _guess(table, read_kwargs):
     original args supplied in the read() call. Then try the standard guess
     keyword args. For each key/val pair specified explicitly in the read()
     call make sure that if there is a corresponding definition in the guess
-    then it must have the same val.  If not then skip this guess."""
+    then it must have the same val.  If not then skip this guess.
+
+    :returns: tuple (output table, keyword args used to read the table)
+    """
 
     # Keep a trace of all failed guesses kwarg
     failed_kwargs = []
 
+    # Each guess reads a file-like table from its current position
+    rewind = _get_rewind(table)
+    if rewind is None:
+        table = list(core.BaseInputter().iter_lines(table))
+        rewind = lambda: None
+
     # First try guessing
     for guess_kwargs in [read_kwargs.copy()] + _get_guess_kwargs_list():
         guess_kwargs_ok = True  # guess_kwargs are consistent with user_kwargs?
@@ -172,7 +399,8 @@ def _guess(table, read_kwargs):
 
         try:
             reader = get_reader(**guess_kwargs)
-            dat = reader.read(table)
+            rewind()
+            dat = _read_converted(reader, table)
             # When guessing impose additional requirements on column names and number of cols
             bads = [" ", ",", "|", "\t", "'", '"']
             if (len(reader.cols) <= 1 or
@@ -181,7 +409,7 @@ def _guess(table, read_kwargs):
                      col.name[0] in bads or 
                      col.name[-1] in bads for col in reader.cols)):
                 raise ValueError
-            return dat
+            return dat, guess_kwargs
         except (core.InconsistentTableError, ValueError, TypeError):
             failed_kwargs.append(guess_kwargs)
             pass
@@ -189,7 +417,8 @@ def _guess(table, read_kwargs):
         # failed all guesses, try the original read_kwargs without column requirements
         try:
             reader = get_reader(**read_kwargs)
-            return reader.read(table)
+            rewind()
+            return _read_converted(reader, table), read_kwargs
         except (core.InconsistentTableError, ValueError):
             failed_kwargs.append(read_kwargs)
             lines = ['\nERROR: Unable to guess table for with the guesses listed below:']
@@ -204,6 +433,26 @@ def _guess(table, read_kwargs):
             lines.append('Check the table and try with guess=False and appropriate arguments to read()')
             raise core.InconsistentTableError('\n'.join(lines))
     
+def _read_converted(reader, table):
+    """Read ``table`` with ``reader`` for a guess, converting every column of
+    a LazyTable output so that a wrong guess fails now and not on the first
+    access of a column."""
+    dat = reader.read(table)
+    if isinstance(dat, core.LazyTable):
+        dat.convert_all()
+    return dat
+
+def _get_rewind(table):
+    """Return a function that restores the file-like ``table`` to its current
+    position so that it can be read again, or None if that is not possible."""
+    if not hasattr(table, 'read'):
+        return lambda: None
+    try:
+        pos = table.tell()
+    except (AttributeError, IOError, ValueError):
+        return None
+    return lambda: table.seek(pos)
+
 def _get_guess_kwargs_list():
     guess_kwargs_list = [dict(Reader=basic.Rdb),
                          dict(Reader=basic.Tab),
@@ -257,15 +506,7 @@ def write(table, output=sys.stdout,  Writer=None, **kwargs):
     :param exclude_names: list of names to exlude from output (applied after ``include_names``)
     """
 
-    reader_kwargs = dict((key, val) for key, val in kwargs.items()
-                         if key in ('names', 'include_names', 'exclude_names'))
-    if not isinstance(table, core.BaseReader) or reader_kwargs:
-        reader = get_reader(Reader=memory.Memory, **reader_kwargs)
-        reader.read(table)
-        table = reader
-
-    writer = get_writer(Writer=Writer, **kwargs)
-    lines = writer.write(table)
+    lines = _get_write_lines(table, Writer, kwargs)
 
     # Write the lines to output 
     outstr = os.linesep.join(lines)
@@ -278,3 +519,14 @@ def write(table, output=sys.stdout,  Writer=None, **kwargs):
         output.write(outstr)
         output.write(os.linesep)
 
+def _get_write_lines(table, Writer, kwargs):
+    """Return the output lines for writing ``table`` (see write())."""
+    reader_kwargs = dict((key, val) for key, val in kwargs.items()
+                         if key in ('names', 'include_names', 'exclude_names'))
+    if not isinstance(table, core.BaseReader) or reader_kwargs:
+        reader = get_reader(Reader=memory.Memory, **reader_kwargs)
+        reader.read(table)
+        table = reader
+
+    writer = get_writer(Writer=Writer, **kwargs)
+    return writer.write(table)
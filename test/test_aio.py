@@ -0,0 +1,76 @@
+import io
+import asyncio
+from nose.tools import *
+
+import asciitable
+from test.common import has_numpy_and_not_has_numpy
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+def _stream_reader(data, chunk_size=7):
+    stream = asyncio.StreamReader()
+    for i in range(0, len(data), chunk_size):
+        stream.feed_data(data[i:i + chunk_size])
+    stream.feed_eof()
+    return stream
+
+@has_numpy_and_not_has_numpy
+def test_aread_stream(numpy):
+    data = open('t/test4.dat', 'rb').read()
+    ref = asciitable.read('t/test4.dat', numpy=numpy)
+
+    async def read_stream(**kwargs):
+        return await asciitable.aread(_stream_reader(data), numpy=numpy, **kwargs)
+
+    for kwargs in ({}, {'Reader': asciitable.Basic, 'guess': False}):
+        dat = _run(read_stream(**kwargs))
+        assert_equal(dat.dtype.names, ref.dtype.names)
+        for name in ref.dtype.names:
+            assert_equal(list(dat[name]), list(ref[name]))
+
+    dat = _run(read_stream(Reader=asciitable.Basic, guess=False, nrows=2))
+    assert_equal(len(dat), 2)
+
+def test_aread_open_stream():
+    """The read returns when the rows are parsed although the stream is open"""
+    async def read_open_stream(data, eof, **kwargs):
+        stream = asyncio.StreamReader()
+        stream.feed_data(data)
+        if eof:
+            stream.feed_eof()
+        read = asciitable.aread(stream, Reader=asciitable.Basic, guess=False, **kwargs)
+        return await asyncio.wait_for(read, 10)
+
+    data = open('t/test4.dat', 'rb').read()
+    dat = _run(read_open_stream(data, False, nrows=2))
+    assert_equal(len(dat), 2)
+
+    # Errors of the reader are raised whether or not the stream is open
+    for eof in (True, False):
+        assert_raises(asciitable.InconsistentTableError, _run,
+                      read_open_stream(b'a b\n1 2\n3\n', eof, nrows=2))
+
+def test_aread_file():
+    dat = _run(asciitable.aread('t/short.rdb'))
+    assert_equal(len(dat), 7)
+
+def test_awrite_stream():
+    table = asciitable.read('t/test4.dat')
+    out = io.StringIO()
+    asciitable.write(table, out, Writer=asciitable.Tab)
+
+    class Writer(object):
+        data = b''
+        def write(self, data):
+            self.data += data
+        async def drain(self):
+            pass
+
+    writer = Writer()
+    _run(asciitable.awrite(table, writer, Writer=asciitable.Tab, encoding='ascii'))
+    assert_equal(writer.data.decode('ascii'), out.getvalue())
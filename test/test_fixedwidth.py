@@ -211,6 +211,49 @@ table = """\
 """
 dat = asciitable.read(table, Reader=asciitable.FixedWidth)
 
+@has_numpy_and_not_has_numpy
+def test_read_process_val(numpy):
+    """Custom or disabled value processing in the splitter is honored"""
+    table = """
+|  Col1  |  Col2   |
+|  1.2   | hello   |
+"""
+    reader = asciitable.get_reader(Reader=asciitable.FixedWidth, numpy=numpy)
+    reader.data.splitter.process_val = lambda x: x.strip().upper()
+    dat = reader.read(table)
+    assert_equal(dat['Col2'][0], 'HELLO')
+
+    reader = asciitable.get_reader(Reader=asciitable.FixedWidth, numpy=numpy)
+    reader.data.splitter.process_val = None
+    dat = reader.read(table)
+    assert_equal(dat['Col2'][0], ' hello   ')
+
+@has_numpy
+def test_split_columns(numpy):
+    """Vectorized column splitting gives the same table as splitting each line"""
+    table = """
+|  Col1  |  Col2   | Col3 |
+|  1.2   | "hello" |   3  |
+|  2.4   |'s worlds|
+| 10     |         |  -4  |
+"""
+    reader = asciitable.get_reader(Reader=asciitable.FixedWidth)
+    dat = reader.read(table)
+    assert_equal(list(dat['Col1']), [1.2, 2.4, 10.0])
+    assert_equal(list(dat['Col2']), ['"hello"', "'s worlds", ''])
+    assert_equal(list(dat['Col3']), ['3', '', '-4'])
+
+    splitter = reader.data.splitter
+    assert_equal([list(x) for x in splitter.split_columns(reader.data.data_lines)],
+                 [[b'1.2', b'2.4', b'10'], [b'"hello"', b"'s worlds", b''], [b'3', b'', b'-4']])
+    splitter.process_val = lambda x: x.strip('|')
+    assert_true(splitter.split_columns(reader.data.data_lines) is None)
+
+    # Non-ASCII lines are split one at a time since positions count characters
+    reader = asciitable.get_reader(Reader=asciitable.FixedWidth)
+    dat = reader.read(table.replace('hello', u'h\u00e9llo'))
+    assert_equal(dat['Col2'][0], u'"h\u00e9llo"')
+
 @has_numpy_and_not_has_numpy
 def test_write_normal(numpy):
     """Write a table as a normal fixed width table."""
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from nose.tools import *
+
+import asciitable
+from test.common import has_numpy_and_not_has_numpy
+
+def _append(filename, text):
+    fileobj = open(filename, 'ab')
+    fileobj.write(text.encode('ascii'))
+    fileobj.close()
+
+@has_numpy_and_not_has_numpy
+def test_poll(numpy):
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.close(fd)
+    try:
+        reader = asciitable.IncrementalReader(filename, asciitable.get_reader(Reader=asciitable.Basic,
+                                                                              numpy=numpy))
+        assert_true(reader.poll() is None)
+        _append(filename, '# comment\na b\n')
+        assert_true(reader.poll() is None)
+        _append(filename, '1 x\n2 y\n3')
+        dat = reader.poll()
+        assert_equal(list(dat['a']), [1, 2])
+        assert_equal(list(dat['b']), ['x', 'y'])
+        assert_true(reader.poll() is None)
+        _append(filename, ' z\n# more\n\n4 w\n')
+        dat = reader.poll()
+        assert_equal(list(dat['a']), [3, 4])
+        assert_equal(list(dat['b']), ['z', 'w'])
+
+        # Replacing the file starts reading from the beginning again
+        open(filename, 'w').write('a b\n5 v\n')
+        dat = reader.poll()
+        assert_equal(list(dat['a']), [5])
+    finally:
+        os.remove(filename)
+
+@has_numpy_and_not_has_numpy
+def test_poll_error(numpy):
+    """Rows that fail to parse are read again by the next poll()"""
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.close(fd)
+    try:
+        reader = asciitable.IncrementalReader(filename, asciitable.get_reader(Reader=asciitable.Basic,
+                                                                              numpy=numpy))
+        _append(filename, 'a b\n1 x\n')
+        assert_equal(list(reader.poll()['a']), [1])
+        _append(filename, '2.5 y\n3 z\n')
+        assert_raises(ValueError, reader.poll)
+        assert_raises(ValueError, reader.poll)
+        reader.col_types = None
+        dat = reader.poll()
+        assert_equal(list(dat['a']), [2.5, 3.0])
+        assert_equal(list(dat['b']), ['y', 'z'])
+        assert_true(reader.poll() is None)
+
+        _append(filename, '4 w\n5\n')
+        assert_raises(asciitable.InconsistentTableError, reader.poll)
+        assert_raises(asciitable.InconsistentTableError, reader.poll)
+    finally:
+        os.remove(filename)
+
+def test_poll_numeric():
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.close(fd)
+    try:
+        reader = asciitable.IncrementalReader(filename, asciitable.get_reader(Reader=asciitable.Basic))
+        _append(filename, 'a b\n1 2\n3 4\n')
+        assert_equal(list(reader.poll()['b']), [2, 4])
+        _append(filename, '5 6\n')
+        assert_equal(list(reader.poll()['a']), [5])
+    finally:
+        os.remove(filename)
+
+def test_poll_fixed_width():
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.close(fd)
+    try:
+        reader = asciitable.IncrementalReader(filename, asciitable.get_reader(Reader=asciitable.FixedWidth))
+        _append(filename, '| a | bb |\n| 1 | x  |\n')
+        dat = reader.poll()
+        assert_equal(list(dat['bb']), ['x'])
+        _append(filename, '| 22| yy |\n')
+        dat = reader.poll()
+        assert_equal(list(dat['a']), [22])
+        assert_equal(list(dat['bb']), ['yy'])
+    finally:
+        os.remove(filename)
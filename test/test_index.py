@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+from nose.tools import *
+
+import asciitable
+from test.common import has_numpy_and_not_has_numpy
+
+def _copy_to_tmp(filename):
+    tmpdir = tempfile.mkdtemp()
+    tmpfile = os.path.join(tmpdir, os.path.basename(filename))
+    shutil.copy(filename, tmpfile)
+    return tmpdir, tmpfile
+
+def _rows(data, colname):
+    return list(data[colname])
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_indexed(numpy):
+    tmpdir, f = _copy_to_tmp('t/test4.dat')
+    try:
+        data = asciitable.read(f, numpy=numpy, guess=False)
+        index_file = asciitable.build_index(f, every=100)
+        assert_equal(index_file, f + '.idx')
+        assert_true(asciitable.index.load_index(f) is not None)
+        for rows in (slice(0, 10), slice(250, 330), slice(1100, None), slice(5, 500, 7)):
+            subset = asciitable.read(f, numpy=numpy, rows=rows)
+            for colname in ('zabs1.nh', 'p1.gamma', 'statname'):
+                assert_equal(_rows(subset, colname), _rows(data, colname)[rows])
+    finally:
+        shutil.rmtree(tmpdir)
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_cds(numpy):
+    tmpdir, f = _copy_to_tmp('t/cds.dat')
+    try:
+        asciitable.build_index(f, every=1, Reader=asciitable.Cds)
+        subset = asciitable.read(f, numpy=numpy, rows=slice(0, 1), Reader=asciitable.Cds)
+        assert_equal(_rows(subset, 'Index'), [1])
+    finally:
+        shutil.rmtree(tmpdir)
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_stale_index(numpy):
+    tmpdir, f = _copy_to_tmp('t/short.rdb')
+    try:
+        asciitable.build_index(f, every=2, Reader=asciitable.Rdb)
+        fileobj = open(f, 'a')
+        fileobj.write('1\t2\t3\n')
+        fileobj.close()
+        assert_true(asciitable.index.load_index(f) is None)
+        subset = asciitable.read(f, numpy=numpy, rows=slice(6, None), Reader=asciitable.Rdb)
+        assert_equal(_rows(subset, 'n_obs'), [24, 3])
+    finally:
+        shutil.rmtree(tmpdir)
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_no_index(numpy):
+    table = ['a b', '1 2', '# comment', '3 4', '5 6']
+    subset = asciitable.read(table, numpy=numpy, rows=slice(1, 3))
+    assert_equal(_rows(subset, 'a'), [3, 5])
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_encoding(numpy):
+    tmpdir = tempfile.mkdtemp()
+    f = os.path.join(tmpdir, 'latin1.dat')
+    try:
+        fileobj = open(f, 'wb')
+        fileobj.write(u'a b\n1 caf\xe9\n2 x\n3 \xe0\n'.encode('latin-1'))
+        fileobj.close()
+        for build in (False, True):
+            if build:
+                asciitable.build_index(f, every=1, encoding='latin-1')
+            subset = asciitable.read(f, numpy=numpy, encoding='latin-1', rows=slice(0, 3, 2))
+            assert_equal(_rows(subset, 'b'), [u'caf\xe9', u'\xe0'])
+        # Without the encoding the guess fails instead of the head lines decoding
+        assert_raises(asciitable.InconsistentTableError, asciitable.read, f, numpy=numpy,
+                      encoding='utf-8', rows=slice(0, 3, 2))
+    finally:
+        shutil.rmtree(tmpdir)
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_guess(numpy):
+    """The table format is guessed as for reading the whole table"""
+    tmpdir, f = _copy_to_tmp('t/short.rdb')
+    try:
+        data = asciitable.read(f, numpy=numpy)
+        for build in (False, True):
+            if build:
+                asciitable.build_index(f, every=2, Reader=asciitable.Rdb)
+            subset = asciitable.read(f, numpy=numpy, rows=slice(1, 5))
+            assert_equal(subset.dtype.names, data.dtype.names)
+            assert_equal(_rows(subset, 'n_obs'), _rows(data, 'n_obs')[1:5])
+            for rows in (slice(-2, None), slice(0, -1), slice(None, None, -1)):
+                assert_raises(ValueError, asciitable.read, f, numpy=numpy, rows=rows)
+    finally:
+        shutil.rmtree(tmpdir)
+
+@has_numpy_and_not_has_numpy
+def test_read_rows_empty(numpy):
+    tmpdir = tempfile.mkdtemp()
+    f = os.path.join(tmpdir, 'noheader.dat')
+    try:
+        fileobj = open(f, 'w')
+        fileobj.write('1 2\n3 4\n5 6\n')
+        fileobj.close()
+        for build in (False, True):
+            if build:
+                asciitable.build_index(f, every=2, Reader=asciitable.NoHeader)
+            for rows in (slice(10, 20), slice(2, 1)):
+                subset = asciitable.read(f, numpy=numpy, rows=rows, Reader=asciitable.NoHeader)
+                assert_equal(subset.dtype.names, ('col1', 'col2'))
+                assert_equal(len(subset), 0)
+    finally:
+        shutil.rmtree(tmpdir)
@@ -84,3 +84,23 @@ def test_memory_from_DOL(numpy):
         assert(mem_data[0] == [1, 4, 8])
         assert(mem_data['c2'] == [4, 5.2, 6.1])
         assert(mem_data['c3'] == [8, 9, 'hello'])
+
+@has_numpy_and_not_has_numpy
+def test_memory_include_names(numpy):
+    data = {'c1': [1, 2, 3], 'c2': [4, 5.2, 6.1], 'c3': [8, 9, 'hello']}
+    all_data = asciitable.read(data, Reader=asciitable.Memory, numpy=numpy)
+    mem_data = asciitable.read(data, Reader=asciitable.Memory, include_names=['c3', 'c1'],
+                               numpy=numpy)
+    assert_equal(mem_data.dtype.names, ('c1', 'c3'))
+    assert_equal(list(mem_data['c3']), list(all_data['c3']))
+    if numpy:
+        mem_data = asciitable.read(mem_data, Reader=asciitable.Memory, include_names=['c1'])
+        assert_equal(mem_data.dtype.names, ('c1',))
+        assert_equal(list(mem_data['c1']), [1, 2, 3])
+
+@has_numpy_and_not_has_numpy
+def test_memory_where(numpy):
+    data = {'c1': [1, 2, 3], 'c2': [4, 5.2, 6.1], 'c3': [8, 9, 'hello']}
+    mem_data = asciitable.read(data, Reader=asciitable.Memory, where=('c2', '>', 5),
+                               include_names=['c1'], numpy=numpy)
+    assert_equal(list(mem_data['c1']), [2, 3])
@@ -4,6 +4,8 @@ import math
 from nose.tools import *
 
 import asciitable
+import asciitable.core as core
+import asciitable.latex
 if asciitable.has_numpy:
     import numpy as np
 
@@ -110,6 +112,239 @@ def test_set_include_names(numpy):
                            delimiter='|', numpy=numpy)
     assert_equal(data.dtype.names, include_names)
 
+@has_numpy_and_not_has_numpy
+def test_include_names_split_values(numpy):
+    """Only the values of included columns are processed by the splitter"""
+    table = ['a , b , c', ' 1 , x , 3 ', '4 ,  y,6']
+    reader = asciitable.get_reader(Reader=asciitable.Basic, delimiter=',',
+                                   include_names=['c', 'a'], numpy=numpy)
+    data = reader.read(table)
+    assert_equal(reader.data.splitter.col_indexes, [0, 2])
+    assert_equal(list(next(reader.data.get_str_vals())), ['1', 'x ', '3'])
+    assert_equal(list(data['a']), [1, 4])
+    assert_equal(list(data['c']), [3, 6])
+
+    reader = asciitable.get_reader(Reader=asciitable.Basic, delimiter=',', numpy=numpy)
+    reader.read(table)
+    assert_true(reader.data.splitter.col_indexes is None)
+
+@has_numpy
+def test_read_numeric(numpy):
+    """All-numeric tables are split and converted at once with the same
+    column types as when converting one column at a time"""
+    tables = (['a b c d', '1 2.5 3.0 -4', '5 6 1e2 +7'],
+              ['a,b,c,d', '1, 2.5,3.0,-4', '5,6 ,1e2,+7'],
+              ['a b c d', '1 2.5 3.0 -4', '5 6 1e2 x'],
+              ['a b c d', '1 2.5 3.0 -4', '5 6 nan 99999999999'])
+    for table in tables:
+        delimiter = ',' if ',' in table[0] else '\s'
+        ref = asciitable.read(table, Reader=asciitable.Basic, delimiter=delimiter,
+                              numeric=False)
+        for numeric in (None, True):
+            reader = asciitable.get_reader(Reader=asciitable.Basic, delimiter=delimiter,
+                                           numeric=numeric)
+            data = reader.read(table)
+            assert_equal(data.dtype, ref.dtype)
+            for name in ref.dtype.names:
+                assert_true(np.all((data[name] == ref[name]) | (data[name] != data[name])))
+            assert_equal(reader.cols[0].str_vals == [], table[2][-1] != 'x')
+
+    assert_equal(asciitable.read(table, Reader=asciitable.Basic, converters={
+        'a': [asciitable.convert_numpy(np.float)]})['a'].dtype.kind, 'f')
+    assert_raises(asciitable.InconsistentTableError, asciitable.read,
+                  ['a b', '1 2', '3'], Reader=asciitable.Basic)
+
+@has_numpy_and_not_has_numpy
+def test_read_where(numpy):
+    """Only the data rows selected by where are converted and output"""
+    table = ['name mag z', 'a 17.5 1', 'b 19 2', 'c -- 3', 'd 12 4']
+    for encoding in (None, 'ascii'):
+        def read(**kwargs):
+            return asciitable.read(table, Reader=asciitable.Basic, encoding=encoding,
+                                   numpy=numpy, **kwargs)
+        assert_equal(list(read(where=('mag', '<', 18))['name']), ['a', 'd'])
+        assert_equal(list(read(where=[('mag', '<', 18), ('name', '!=', 'a')])['z']), [4])
+        assert_equal(list(read(where=('name', '>=', 'c'), include_names=['z'])['z']), [3, 4])
+        assert_equal(list(read(where=lambda row: row['mag'] == '--')['z']), [3])
+        assert_equal(len(read(where=('z', '>', 9))['z']), 0)
+        assert_raises(ValueError, read, where=('x', '<', 1))
+        assert_raises(ValueError, read, where=('z', '=', 1))
+
+    table = ['|  Col1  |  Col2   |  Col3 |',
+             '|  1.2   | "hello" |     3 |',
+             '|  2.4   |\'s worlds|     7 |']
+    data = asciitable.read(table, Reader=asciitable.FixedWidth, include_names=['Col3'],
+                           where=('Col3', '>', 5), numpy=numpy)
+    assert_equal(list(data['Col3']), [7])
+
+    # The where columns need not be in the output of readers that split the
+    # header columns by position
+    for guess in (False, True):
+        data = asciitable.read(table, Reader=asciitable.FixedWidth, include_names=['Col3'],
+                               where=('Col1', '>', 2), numpy=numpy, guess=guess)
+        assert_equal(data.dtype.names, ('Col3',))
+        assert_equal(list(data['Col3']), [7])
+    data = asciitable.read(table, Reader=asciitable.FixedWidth, exclude_names=['Col2'],
+                           where=lambda row: row['Col2'] == '"hello"', numpy=numpy)
+    assert_equal(data.dtype.names, ('Col1', 'Col3'))
+    assert_equal(list(data['Col3']), [3])
+    data = asciitable.read('t/ipac.dat', Reader=asciitable.Ipac, include_names=['ra'],
+                           where=('dec', '>', 30), numpy=numpy)
+    assert_equal(data.dtype.names, ('ra',))
+    assert_equal(len(data), 1)
+    assert_raises(ValueError, asciitable.read, table, Reader=asciitable.FixedWidth,
+                  include_names=['Col3'], where=('Col9', '>', 2), numpy=numpy, guess=False)
+
+@has_numpy_and_not_has_numpy
+def test_latex_single_scan(numpy):
+    """The LaTeX table markers are found with one pass over the data lines"""
+    class Lines(list):
+        n_iter = 0
+        def __iter__(self):
+            Lines.n_iter += 1
+            return list.__iter__(self)
+
+    for Reader, table in ((asciitable.Latex, 't/latex1.tex'),
+                          (asciitable.AASTex, 't/latex2.tex')):
+        reader = asciitable.get_reader(Reader=Reader, numpy=numpy)
+        reader.data.process_lines = lambda lines: Lines(core.BaseData.process_lines(reader.data, lines))
+        Lines.n_iter = 0
+        dat = reader.read(table)
+        assert_equal(Lines.n_iter, 1)
+        assert_equal(dat.dtype.names, get_testfiles(table)['cols'])
+
+@has_numpy_and_not_has_numpy
+def test_line_classes(numpy):
+    """The data line classes are used for the header and comment lines"""
+    table = ['# c1', 'a b', '  # c2', '1 2', '  ', '', '3 4']
+    # Count the classification passes and the comment_lines passes without classes
+    classify_lines = core._classify_lines
+    comment_char = core._comment_char
+    calls = []
+    def counted_classify_lines(*args):
+        calls.append('classify')
+        return classify_lines(*args)
+    def counted_comment_char(comment):
+        calls.append('comment_char')
+        return comment_char(comment)
+
+    core._classify_lines = counted_classify_lines
+    core._comment_char = counted_comment_char
+    try:
+        for encoding in (None, 'utf-8'):
+            calls[:] = []
+            reader = asciitable.get_reader(Reader=asciitable.Basic, encoding=encoding,
+                                           numpy=numpy)
+            dat = reader.read(table)
+            assert_equal(list(dat['b']), [2, 4])
+            assert_equal(list(reader.data.get_line_classes(reader.lines, reader.header.comment)),
+                         [1, 2, 1, 2, 0, 0, 2])
+            assert_equal(reader.comment_lines, ['# c1', '  # c2'])
+            # The classes were used for the comment lines and then dropped
+            assert_equal(calls, ['classify', 'comment_char'])
+            assert_true(reader.data.get_line_classes(reader.lines, reader.header.comment) is None)
+            assert_equal(reader.comment_lines, ['# c1', '  # c2'])
+    finally:
+        core._classify_lines = classify_lines
+        core._comment_char = comment_char
+
+    reader.data.process_lines(table)
+    assert_equal(list(reader.header.process_lines(table)), ['a b', '1 2', '  ', '3 4'])
+    assert_true(reader.data.get_line_classes(list(table), reader.header.comment) is None)
+
+    reader = asciitable.get_reader(Reader=asciitable.NoHeader, data_start=-2, numpy=numpy)
+    assert_equal(list(reader.read(table)['col2']), [2, 4])
+
+@has_numpy_and_not_has_numpy
+def test_read_transposed_rows(numpy):
+    """Rows are accumulated into the columns in transposed blocks"""
+    table = ['a b c d'] + ['%d x%d "y %d" z' % (i, i, i) for i in range(600)]
+    for include_names in (None, ['c']):
+        dat = asciitable.read(table, Reader=asciitable.Basic, guess=False,
+                              include_names=include_names, numpy=numpy)
+        assert_equal(len(dat), 600)
+        assert_equal(dat['c'][0], 'y 0')
+        assert_equal(dat['c'][599], 'y 599')
+    dat = asciitable.read(table, Reader=asciitable.Basic, where=('a', '>=', 300), numpy=numpy)
+    assert_equal(list(dat['a']), list(range(300, 600)))
+
+@has_numpy_and_not_has_numpy
+def test_convert_inferred(numpy):
+    """Columns whose type changes after many values convert as a whole"""
+    n_rows = asciitable.core._CONVERT_ROWS * 2 + 10
+    table = ['a b c d'] + ['%d %d x%d %d' % (i, i, i, i) for i in range(n_rows)]
+    table[-1] = '1 2.5 x 3.5e0'
+    table[-2] = '2 4 x y'
+    dat = asciitable.read(table, Reader=asciitable.Basic, guess=False, numpy=numpy)
+    assert_equal(dat['a'][0], 0)
+    assert_equal(dat['b'][0], 0.0)
+    assert_equal(dat['b'][-1], 2.5)
+    assert_equal(dat['d'][0], '0')
+    assert_equal(dat['d'][-1], '3.5e0')
+    if numpy:
+        assert_equal(dat['a'].dtype.kind, 'i')
+        assert_equal(dat['b'].dtype.kind, 'f')
+        assert_true(dat['d'].dtype.kind in 'SU')
+
+@has_numpy_and_not_has_numpy
+def test_infer_rows(numpy):
+    """Column types inferred from a sample are widened when the bulk conversion fails"""
+    table = ['a b c d'] + ['%d %d x%d %d' % (i, i, i, i) for i in range(1000)]
+    table[-1] = '1 2.5 x 3.5e0'
+    table[-2] = '2 4 x y'
+    ref = asciitable.read(table, Reader=asciitable.Basic, guess=False, numpy=numpy)
+    for infer_rows in (0, 10, 2000):
+        dat = asciitable.read(table, Reader=asciitable.Basic, guess=False, numpy=numpy,
+                              infer_rows=infer_rows)
+        for name in ('a', 'b', 'c', 'd'):
+            assert_equal(list(dat[name]), list(ref[name]))
+            if numpy:
+                assert_equal(dat[name].dtype, ref[name].dtype)
+
+@has_numpy
+def test_lazy_outputter(numpy):
+    """Columns of a LazyTable are converted on first access"""
+    f = 't/simple.txt'
+    testfile = get_testfiles(f)
+    ref = asciitable.read(f, **testfile['opts'])
+    reader = asciitable.get_reader(Outputter=asciitable.LazyOutputter, **testfile['opts'])
+    dat = reader.read(f)
+    assert_true(isinstance(dat, asciitable.LazyTable))
+    assert_equal(dat.dtype.names, ref.dtype.names)
+    assert_equal(len(dat), len(ref))
+    assert_false(any(hasattr(col, 'data') for col in reader.cols))
+
+    assert_true((dat.get('test2') == ref['test2']).all())
+    assert_true(dat['test2'] is dat['test2'])
+    assert_true(dat.get('no_such_col') is None)
+    assert_equal([col.name for col in reader.cols if hasattr(col, 'data')], ['test2'])
+
+    assert_equal([list(x) for x in dat], [list(x) for x in ref])
+    for name in ref.dtype.names:
+        assert_equal(dat[name].dtype, ref[name].dtype)
+
+@has_numpy
+def test_lazy_outputter_guess(numpy):
+    """Guessing converts the columns so that a wrong guess is rejected"""
+    f = 't/simple.txt'
+    testfile = get_testfiles(f)
+    ref = asciitable.read(f, **testfile['opts'])
+    dat = asciitable.read(f, Outputter=asciitable.LazyOutputter)
+    assert_equal(dat.dtype.names, ref.dtype.names)
+    assert_equal(repr(dat), '<LazyTable with columns (%s) and %d rows>' %
+                 (', '.join(ref.dtype.names), len(ref)))
+    assert_raises(asciitable.InconsistentTableError, asciitable.read, 't/vizier/ReadMe',
+                  Outputter=asciitable.LazyOutputter)
+
+@has_numpy
+def test_lazy_outputter_masked(numpy):
+    f = 't/fill_values.txt'
+    testfile = get_testfiles(f)
+    dat = asciitable.read(f, Outputter=asciitable.LazyOutputter, fill_values=('a', '1'),
+                          **testfile['opts'])
+    assert_equal(list(dat['a'].mask), [False, True])
+    assert_equal(list(dat['b'].data), [2, 1])
+
 @has_numpy_and_not_has_numpy
 def test_set_exclude_names(numpy):
     exclude_names = ('Y', 'object')
@@ -173,6 +408,32 @@ def test_set_converters(numpy):
     assert_equal(str(data['zabs1.nh'].dtype), 'float32')
     assert_equal(data['p1.gamma'][0], '1.26764544642')
 
+@has_numpy_and_not_has_numpy
+def test_custom_converter_str_vals(numpy):
+    """Custom converters get a list of str for the column-wise split readers"""
+    def upper(vals):
+        assert_true(type(vals) is list)
+        assert_true(all(type(x) is str for x in vals))
+        return [x.upper() for x in vals]
+    converter = (upper, asciitable.StrType)
+
+    fixed_width = ['| a | name  |', '| 1 | x1    |', '| 2 | y2    |']
+    for table, opts, name in ((fixed_width, {'Reader': asciitable.FixedWidth}, 'name'),
+                              (fixed_width, {'Reader': asciitable.FixedWidth,
+                                             'encoding': 'utf-8'}, 'name'),
+                              ('t/cds.dat', {'Reader': asciitable.Cds}, 'Class'),
+                              ('t/ipac.dat', {'Reader': asciitable.Ipac}, 'sptype')):
+        dat = asciitable.read(table, numpy=numpy, guess=False, converters={name: [converter]},
+                              **opts)
+        ref = asciitable.read(table, numpy=numpy, guess=False, **opts)
+        assert_equal(list(dat[name]), [x.upper() for x in ref[name]])
+
+    # Also with the fill values replaced in the column arrays
+    dat = asciitable.read(fixed_width, numpy=numpy, Reader=asciitable.FixedWidth,
+                          fill_values=[('x1', 'z1')], converters={'name': [converter]})
+    vals = dat['name'].data if numpy else dat['name']
+    assert_equal(list(vals), ['Z1', 'Y2'])
+
 @has_numpy_and_not_has_numpy
 def test_from_string(numpy):
     f = 't/simple.txt'
@@ -266,6 +527,38 @@ def test_fill_values_list(numpy):
     else:
         assert_equal(data['a'],[42,42])
 
+@has_numpy_and_not_has_numpy
+def test_fill_values_fixed_width(numpy):
+    """Bad values are replaced in the column arrays of a fixed width table"""
+    table = ['| a | b |', '| 1 | x |', '|   | y |', '| 3 | - |']
+    data = asciitable.read(table, Reader=asciitable.FixedWidth, numpy=numpy,
+                           fill_values=[('', '-99'), ('-', 'missing')])
+    if numpy:
+        assert_equal(list(data.mask['a']), [False, True, False])
+        assert_equal(list(data.data['a']), [1, -99, 3])
+        assert_equal(list(data.mask['b']), [False, False, True])
+        assert_equal(list(data.data['b']), ['x', 'y', 'missing'])
+    else:
+        assert_equal(data['a'], [1, -99, 3])
+        assert_equal(data['b'], ['x', 'y', 'missing'])
+
+@has_numpy_and_not_has_numpy
+def test_fill_values_non_ascii(numpy):
+    """Fill values that are not ASCII work for columns split as ASCII bytes"""
+    table = ['| a | b |', '| 1 | x |', '| 2 | - |']
+    for guess in (False, True):
+        data = asciitable.read(table, Reader=asciitable.FixedWidth, numpy=numpy, guess=guess,
+                               fill_values=[(u'\u2014', '0'), ('-', '0')])
+        assert_equal(list(data['a']), [1, 2])
+        if numpy:
+            assert_equal(list(data.mask['b']), [False, True])
+        data = asciitable.read(table, Reader=asciitable.FixedWidth, numpy=numpy, guess=guess,
+                               fill_values=('-', u'\u00f1'))
+        if numpy:
+            assert_equal(list(data.data['b']), ['x', u'\u00f1'])
+        else:
+            assert_equal(data['b'], ['x', u'\u00f1'])
+
 @has_numpy_and_not_has_numpy
 def test_masking_Cds(numpy):
     f = 't/cds.dat'
@@ -296,6 +589,258 @@ N\tN
 1\tHello"""
     dat = asciitable.read(table, Reader=asciitable.Rdb)
 
+@has_numpy_and_not_has_numpy
+def test_read_chunks(numpy):
+    f = 't/test4.dat'
+    data = asciitable.read(f, numpy=numpy)
+    chunks = list(asciitable.read_chunks(f, chunk_rows=500, numpy=numpy))
+    assert_equal([len(x) for x in chunks], [500, 500, 172])
+    for chunk in chunks:
+        assert_equal(chunk.dtype.names, data.dtype.names)
+    for colname in data.dtype.names:
+        vals = []
+        for chunk in chunks:
+            vals.extend(chunk[colname])
+        assert_equal(list(vals), list(data[colname]))
+
+@has_numpy_and_not_has_numpy
+def test_read_chunks_no_header(numpy):
+    table = ['# comment', '1 2 a', '', '3 4 b', '5 6 c', 'end of table']
+    chunks = asciitable.read_chunks(table, chunk_rows=2, Reader=asciitable.NoHeader,
+                                    data_end=-1, numpy=numpy)
+    chunks = list(chunks)
+    assert_equal([len(x) for x in chunks], [2, 1])
+    assert_equal(chunks[1].dtype.names, ('col1', 'col2', 'col3'))
+    assert_equal(chunks[1]['col3'][0], 'c')
+
+@has_numpy_and_not_has_numpy
+def test_read_chunks_type_change(numpy):
+    """Column type is fixed by the first chunk"""
+    table = ['a b', '1 2', '3 4', '5 6.5']
+    chunks = asciitable.read_chunks(table, chunk_rows=2, numpy=numpy)
+    assert_equal(list(next(chunks)['b']), [2, 4])
+    convert = asciitable.convert_numpy if numpy else asciitable.convert_list
+    hint = "converters={'b': [asciitable.%s(float)]}" % convert.__name__
+    assert_raises_regexp(asciitable.InconsistentTableError,
+                         'Column b .* data row 2 .*' + re.escape(hint), next, chunks)
+
+    # The converters given in the error message read the whole table
+    converters = {'b': [convert(float)]}
+    chunks = list(asciitable.read_chunks(table, chunk_rows=2, numpy=numpy, converters=converters))
+    assert_equal(list(chunks[0]['b']) + list(chunks[1]['b']), [2.0, 4.0, 6.5])
+    assert_equal(list(chunks[1]['b']),
+                 list(asciitable.read(table, numpy=numpy, guess=False)['b'][2:]))
+
+@has_numpy_and_not_has_numpy
+def test_mmap_inputter(numpy):
+    for testfile in get_testfiles():
+        opts = testfile['opts'].copy()
+        if 'Inputter' in opts or opts.get('Reader') is asciitable.Daophot:
+            continue
+        opts['Inputter'] = asciitable.MmapInputter
+        data = asciitable.read(testfile['name'], numpy=numpy, **opts)
+        assert_equal(data.dtype.names, testfile['cols'])
+        assert_equal(len(data), testfile['nrows'])
+
+@has_numpy_and_not_has_numpy
+def test_mmap_lines(numpy):
+    f = 't/short.rdb'
+    lines = asciitable.MmapLines(f)
+    expected = open(f).read().splitlines()
+    assert_equal(len(lines), len(expected))
+    assert_equal(list(lines), expected)
+    assert_equal(lines[-1], expected[-1])
+    assert_equal(list(lines[2:-1]), expected[2:-1])
+    assert_equal(list(lines[2:][1:3]), expected[2:][1:3])
+
+    flags = bytearray([i % 2 for i in range(len(expected))])
+    odd_lines = lines.compress(flags)
+    assert_true(isinstance(odd_lines, asciitable.MmapLines))
+    assert_equal(list(odd_lines), expected[1::2])
+    assert_equal(odd_lines[1], expected[3])
+    assert_equal(list(odd_lines[1:3]), expected[3:7:2])
+    assert_equal(list(odd_lines.compress(bytearray([0, 1, 1]))), expected[3:7:2])
+    assert_equal(list(lines[2:].compress(flags)), expected[2:][1::2])
+
+    # The data lines of a memory-mapped table are selected without a copy
+    reader = asciitable.get_reader(Reader=asciitable.Rdb, Inputter=asciitable.MmapInputter,
+                                   numpy=numpy)
+    reader.read(f)
+    assert_true(isinstance(reader.data.data_lines, asciitable.MmapLines))
+    data_lines = [x.decode('utf-8') if isinstance(x, bytes) else x
+                  for x in reader.data.data_lines]
+    reader = asciitable.get_reader(Reader=asciitable.Rdb, numpy=numpy)
+    reader.read(f)
+    assert_equal(data_lines, list(reader.data.data_lines))
+
+@has_numpy_and_not_has_numpy
+def test_read_compressed(numpy):
+    expected = asciitable.read('t/short.rdb', numpy=numpy)
+    for suffix in ('.gz', '.bz2', '.xz'):
+        f = 't/short.rdb' + suffix
+        for table in (f, open(f, 'rb')):
+            dat = asciitable.read(table, numpy=numpy, guess=False, Reader=asciitable.Rdb)
+            assert_equal(dat.dtype.names, expected.dtype.names)
+            for colname in expected.dtype.names:
+                assert_equal(list(dat[colname]), list(expected[colname]))
+        chunks = list(asciitable.read_chunks(open(f, 'rb'), chunk_rows=3, numpy=numpy,
+                                             Reader=asciitable.Rdb))
+        assert_equal([len(x) for x in chunks], [3, 3, 1])
+        assert_equal(list(chunks[2]['n_obs']), list(expected['n_obs'][6:]))
+
+@has_numpy_and_not_has_numpy
+def test_read_nrows_skiprows(numpy):
+    f = 't/test4.dat'
+    data = asciitable.read(f, numpy=numpy)
+    for table in (f, open(f, 'r')):
+        dat = asciitable.read(table, numpy=numpy, nrows=10, skiprows=20)
+        assert_equal(dat.dtype.names, data.dtype.names)
+        assert_equal(list(dat['statname']), list(data['statname'][20:30]))
+    dat = asciitable.read(f, numpy=numpy, skiprows=1170)
+    assert_equal(list(dat['statname']), list(data['statname'][1170:]))
+    for guess in (True, False):
+        assert_raises_regexp(ValueError, '^nrows must not be negative', asciitable.read, f,
+                             numpy=numpy, guess=guess, nrows=-1)
+        assert_raises_regexp(ValueError, '^skiprows must not be negative', asciitable.read, f,
+                             numpy=numpy, guess=guess, skiprows=-1, rows=slice(0, 1))
+
+@has_numpy_and_not_has_numpy
+def test_read_nrows_stops_early(numpy):
+    """Lines after the requested rows are not read"""
+    table = ['a b c', '1 2 3', '4 5 6', '7 8']
+    dat = asciitable.read(table, numpy=numpy, guess=False, nrows=2)
+    assert_equal(list(dat['c']), [3, 6])
+    reader = asciitable.get_reader(numpy=numpy, nrows=1)
+    dat = reader.read(table)
+    assert_equal(reader.lines, table[:2])
+
+@has_numpy_and_not_has_numpy
+def test_read_encoding(numpy):
+    reader = asciitable.get_reader(numpy=numpy, encoding='latin-1')
+    dat = reader.read('t/latin1.txt')
+    assert_equal(list(dat['name']), [u'Jos\xe9', u'Zo\xeb B'])
+    assert_equal(list(dat['flux']), [1.5, 2.0])
+
+@has_numpy_and_not_has_numpy
+def test_read_encoding_bytes_data(numpy):
+    f = 't/test4.dat'
+    data = asciitable.read(f, numpy=numpy, guess=False)
+    reader = asciitable.get_reader(numpy=numpy, encoding='utf-8')
+    dat = reader.read(f)
+    if str is not bytes:
+        assert_equal(reader.data.encoding, 'utf-8')
+    for colname in data.dtype.names:
+        assert_equal(list(dat[colname]), list(data[colname]))
+
+    dat = asciitable.read('t/fill_values.txt', numpy=numpy, encoding='utf-8',
+                          fill_values=('a', '1'), delimiter=',')
+    assert_equal(list(dat['c']), [3, 4])
+    if numpy:
+        assert_equal(list(dat['a'].mask), [False, True])
+    else:
+        assert_equal(dat['a'], [1, 1])
+
+def test_whitespace_tabs():
+    """Unquoted tabs are replaced with spaces for the whitespace delimiter"""
+    lines = ['a\tb  "c\td"\te', 'a\t"b\\"\tc"\td', '1 2 3']
+    splitter = asciitable.WhitespaceSplitter()
+    assert_equal(splitter.process_line(lines[0]), 'a b  "c\td" e')
+    assert_equal(splitter.process_line(lines[2]), '1 2 3')
+    splitter.escapechar = '\\'
+    assert_equal(splitter.process_line(lines[1]), 'a "b\\"\tc" d')
+
+    splitter = asciitable.DefaultSplitter()
+    splitter.delimiter = '\s'
+    assert_equal(list(splitter(lines[:1])), [['a', 'b', 'c\td', 'e']])
+
+def test_split_bytes_quoted():
+    """Bytes lines are split like str lines by the csv module"""
+    lines = ['a b  c', ' "x y" 2 3', '', '"multi', 'line" 5 6', "'q' \\ 7"]
+    splitter = asciitable.DefaultSplitter()
+    splitter.process_line = None
+    splitter.escapechar = '\\'
+    text_vals = list(splitter(lines))
+    splitter.encoding = 'utf-8'
+    bytes_vals = list(splitter([x.encode('utf-8') for x in lines]))
+    assert_equal(text_vals[1], ['x y', '2', '3'])
+    assert_equal(text_vals[3], ['multiline', '5', '6'])
+    assert_equal([[x.decode('utf-8') for x in vals] for vals in bytes_vals], text_vals)
+
+@has_numpy_and_not_has_numpy
+def test_read_many(numpy):
+    files = ['t/short.rdb', 't/short.rdb.gz', 't/no_such_file.rdb', 't/short.rdb.bz2']
+    data = asciitable.read(files[0], numpy=numpy)
+    for workers in (1, 2):
+        dats, errors = asciitable.read_many(files, workers=workers, numpy=numpy)
+        assert_equal(sorted(errors), [2])
+        assert_true(dats[2] is None)
+        for dat in (dats[0], dats[1], dats[3]):
+            assert_equal(dat.dtype.names, data.dtype.names)
+            assert_equal(list(dat['n_obs']), list(data['n_obs']))
+
+@has_numpy_and_not_has_numpy
+def test_read_many_concatenate(numpy):
+    files = ['t/fill_values.txt', 't/no_such_file.txt', 't/fill_values.txt']
+    dat, errors = asciitable.read_many(files, concatenate=True, numpy=numpy)
+    assert_equal(sorted(errors), [1])
+    assert_equal(dat.dtype.names, ('a', 'b', 'c'))
+    assert_equal(list(dat['c']), [3, 4, 3, 4])
+
+@raises(ValueError)
+def test_read_many_concatenate_mismatch():
+    asciitable.read_many(['t/fill_values.txt', 't/short.rdb'], concatenate=True)
+
+@has_numpy_and_not_has_numpy
+def test_read_parallel(numpy):
+    import os
+    import tempfile
+    import asciitable.multicore
+    lines = ['# comment', 'a b c']
+    lines += ['%d %d x%d' % (i, i * 2, i) for i in range(200)]
+    lines += ['', '200 4.5 y']
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.write(fd, ('\n'.join(lines) + '\n').encode('ascii'))
+    os.close(fd)
+    min_range_bytes = asciitable.multicore.MIN_RANGE_BYTES
+    asciitable.multicore.MIN_RANGE_BYTES = 100
+    try:
+        data = asciitable.read(filename, numpy=numpy)
+        for kwargs in ({}, {'Reader': asciitable.Basic, 'include_names': ['b', 'c']}):
+            dat = asciitable.read(filename, parallel=3, numpy=numpy, **kwargs)
+            assert_equal(len(dat), 201)
+            for name in dat.dtype.names:
+                assert_equal(list(dat[name]), list(data[name]))
+        # Column b is int in the first ranges and float in the last
+        assert_equal(dat['b'][1], 2.0)
+        assert_equal(dat['b'][200], 4.5)
+    finally:
+        asciitable.multicore.MIN_RANGE_BYTES = min_range_bytes
+        os.remove(filename)
+
+@has_numpy_and_not_has_numpy
+def test_read_parallel_guess(numpy):
+    import os
+    import tempfile
+    import asciitable.multicore
+    # The first 1000 lines also read with the whitespace delimiter but the
+    # last one only fits the comma delimiter.
+    lines = ['a b,c']
+    lines += ['%d %d,%d' % (i, i, i) for i in range(1100)]
+    lines += ['1 2 3,4']
+    fd, filename = tempfile.mkstemp(suffix='.dat')
+    os.write(fd, ('\n'.join(lines) + '\n').encode('ascii'))
+    os.close(fd)
+    min_range_bytes = asciitable.multicore.MIN_RANGE_BYTES
+    asciitable.multicore.MIN_RANGE_BYTES = 100
+    try:
+        dat = asciitable.read(filename, parallel=3, numpy=numpy)
+        assert_equal(dat.dtype.names, ('a b', 'c'))
+        assert_equal(len(dat), 1101)
+        assert_equal(dat['a b'][1100], '1 2 3')
+    finally:
+        asciitable.multicore.MIN_RANGE_BYTES = min_range_bytes
+        os.remove(filename)
+
 def get_testfiles(name=None):
     """Set up information about the columns, number of rows, and reader params to
     read a bunch of test files and verify columns and number of rows."""
@@ -148,3 +148,13 @@ def test_write_table_no_numpy():
         yield check_write_table, test_def, table
         yield check_write_table, test_def, data
 
+def test_write_table_lazy():
+    if not asciitable.has_numpy:
+        return
+    for test_def in test_defs:
+        # Columns that were never accessed are converted for writing
+        table = asciitable.get_reader(Reader=asciitable.Daophot,
+                                      Outputter=asciitable.LazyOutputter)
+        data = table.read('t/daophot.dat')
+        yield check_write_table, test_def, table
+        yield check_write_table, test_def, data